@@ -1,38 +1,270 @@
-import json
+import asyncio
+import mmap
 import os
+import struct
+import msgspec
+import orjson
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Tuple, Union
 from .types import JournalEntry
 from .clock import Clock
 
+SCAN_BLOCK_SIZE = 1 << 20 # bytes of mmapped journal split per step
+
+# Pre-serialized framing of a PACKET line (field order matches JournalEntry)
+_PACKET_LINE_PREFIX = b'{"event_type":"PACKET","timestamp":'
+_DATA_KEY = b',"data":'
+_LINE_END = b"}\n"
+
+# Binary journal: files with these suffixes hold [u32 little-endian length]
+# [msgpack record] frames instead of JSON lines. Decimals encode as strings.
+MSGPACK_SUFFIXES = (".mpk", ".msgpack")
+_FRAME_HEADER = struct.Struct("<I")
+_MSGPACK_ENCODER = msgspec.msgpack.Encoder()
+_MSGPACK_DECODER = msgspec.msgpack.Decoder()
+_JSON_ENCODER = msgspec.json.Encoder()
+
+def is_msgpack_journal(filepath: str) -> bool:
+    return str(filepath).endswith(MSGPACK_SUFFIXES)
+
+def _split_lines(buf, start: int = 0, end: Optional[int] = None):
+    """
+    Yields the non-blank lines of a bytes-like buffer (bytes or mmap) as bytes
+    (without the newline). The buffer is split in blocks of about
+    SCAN_BLOCK_SIZE cut at a newline, so line splitting happens in C
+    (bytes.split) rather than one find() per line.
+    start/end restrict the scan to a byte range that starts at a line start
+    and ends after a newline (or at the end), e.g. from split_journal().
+    """
+    end = len(buf) if end is None else min(end, len(buf))
+    pos = start
+    while pos < end:
+        stop = pos + SCAN_BLOCK_SIZE
+        if stop >= end:
+            stop = end
+        else:
+            nl = buf.rfind(b"\n", pos, stop)
+            if nl < 0:
+                # Single line longer than a block
+                nl = buf.find(b"\n", stop)
+            stop = end if nl < 0 else nl + 1
+        for line in buf[pos:stop].split(b"\n"):
+            if line and not line.isspace():
+                yield line
+        pos = stop
+
+def _iter_lines(filepath: str, start: int = 0, end: Optional[int] = None):
+    """
+    Yields the non-blank lines of a file (see _split_lines). The file is
+    mmapped: no per-line read calls and no text decoding.
+    """
+    with open(filepath, "rb") as f:
+        if not os.fstat(f.fileno()).st_size:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            yield from _split_lines(mm, start, end)
+
+def _iter_frames(filepath: str):
+    """
+    Yields the decoded records of a msgpack journal. The file is mmapped and
+    walked frame by frame; a truncated trailing frame (crash mid-write) is
+    ignored.
+    """
+    with open(filepath, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if not size:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            decode = _MSGPACK_DECODER.decode
+            header = _FRAME_HEADER.unpack_from
+            off = 0
+            while off + 4 <= size:
+                (length,) = header(mm, off)
+                off += 4
+                if off + length > size:
+                    break
+                yield decode(mm[off:off + length])
+                off += length
+
+def split_journal(filepath: str, parts: int) -> List[Tuple[int, int]]:
+    """
+    Splits a JSON-lines journal into at most `parts` byte ranges of about
+    equal size, each cut just after a newline. Returns [(start, end), ...]
+    covering the whole file in order; empty for an empty file.
+    """
+    with open(filepath, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if not size:
+            return []
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            ranges = []
+            start = 0
+            for i in range(1, parts):
+                if start >= size:
+                    break
+                nl = mm.find(b"\n", max(start, size * i // parts))
+                if nl < 0:
+                    break
+                if nl + 1 > start:
+                    ranges.append((start, nl + 1))
+                    start = nl + 1
+            if start < size:
+                ranges.append((start, size))
+            return ranges
+
+def read_records(
+    filepath: Union[str, "os.PathLike[str]", BinaryIO], start: int = 0, end: Optional[int] = None
+) -> Iterator[Dict[str, Any]]:
+    """
+    Yields the raw records (event_type/timestamp/data dicts) of a journal,
+    in file order, for either on-disk format.
+    filepath may also be a binary stream (e.g. io.BytesIO) holding a
+    JSON-lines journal; it is read in full, with no disk access.
+    A byte range (see split_journal) is only supported for JSON lines.
+    """
+    if hasattr(filepath, "read"):
+        loads = orjson.loads
+        for line in _split_lines(filepath.read(), start, end):
+            yield loads(line)
+    elif is_msgpack_journal(filepath):
+        if start or end is not None:
+            raise ValueError("Byte-range reads need a JSON-lines journal")
+        yield from _iter_frames(filepath)
+    else:
+        loads = orjson.loads
+        for line in _iter_lines(filepath, start, end):
+            yield loads(line)
+
 class RawJournal:
     """
     Append-only journal for raw event recording.
-    Writes newline-delimited JSON.
+    Writes newline-delimited JSON, or length-prefixed msgpack frames when the
+    path ends in one of MSGPACK_SUFFIXES.
+
+    Appends are buffered in memory and written out in one os.write() per flush,
+    either by the background flusher (every flush_interval_s) or as soon as the
+    buffer holds max_batch entries or max_buffer_bytes. Everything runs on the
+    event loop thread, so append/flush never interleave and no lock is needed.
+
+    Group commit: the flusher also fsyncs (off the event loop thread) once per
+    interval if anything was written, so one fsync covers a whole batch and
+    the crash-loss window is bounded by flush_interval_s plus the fsync time.
     """
-    def __init__(self, filepath: str = "journal.jsonl"):
+    def __init__(
+        self,
+        filepath: str = "journal.jsonl",
+        flush_interval_s: float = 0.005,
+        max_buffer_bytes: int = 1 << 20,
+        max_batch: int = 512,
+        fsync: bool = True,
+    ):
         self.filepath = filepath
-        # Open in append mode, text
-        self._file = open(self.filepath, "a", buffering=1) # Line buffered
+        self.flush_interval_s = flush_interval_s
+        self.max_buffer_bytes = max_buffer_bytes
+        self.max_batch = max_batch
+        self.fsync = fsync
+        # Raw fd, append mode. O_BINARY keeps Windows from translating newlines.
+        flags = os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, "O_BINARY", 0)
+        self._fd = os.open(self.filepath, flags, 0o644)
+        self._msgpack = is_msgpack_journal(filepath)
+        self._buf = bytearray()
+        self._buffered = 0 # entries in _buf
+        self._unsynced = False # written since the last fsync
 
     def append(self, entry: JournalEntry):
         """
-        Writes a single entry to the journal.
+        Buffers a single entry. Written to disk on the next flush.
+        """
+        if self._msgpack:
+            self._append_frame(entry.__pydantic_serializer__.to_python(entry))
+        else:
+            # Pydantic v2 serializes straight to JSON bytes (no intermediate dict/str).
+            self._buf += entry.__pydantic_serializer__.to_json(entry)
+            self._buf += b"\n"
+        self._buffered += 1
+        if self._buffered >= self.max_batch or len(self._buf) >= self.max_buffer_bytes:
+            self.flush()
+
+    def append_packet(self, timestamp: int, data: Any):
+        """
+        Buffers a PACKET entry without building a JournalEntry.
+        Same line as append(JournalEntry(event_type="PACKET", ...)): the constant
+        parts of the line are pre-serialized, only timestamp and data are encoded.
+        data is normally the Packet struct itself, encoded directly into the
+        buffer (no intermediate dict); plain dicts work as well.
+        """
+        buf = self._buf
+        if self._msgpack:
+            self._append_frame({"event_type": "PACKET", "timestamp": timestamp, "data": data})
+        else:
+            buf += _PACKET_LINE_PREFIX
+            buf += b"%d" % timestamp
+            buf += _DATA_KEY
+            _JSON_ENCODER.encode_into(data, buf, -1)
+            buf += _LINE_END
+        self._buffered += 1
+        if self._buffered >= self.max_batch or len(buf) >= self.max_buffer_bytes:
+            self.flush()
+
+    def _append_frame(self, record: Dict[str, Any]):
+        """Encodes one msgpack frame in place at the end of the buffer."""
+        buf = self._buf
+        start = len(buf)
+        buf += b"\0\0\0\0"
+        _MSGPACK_ENCODER.encode_into(record, buf, -1)
+        _FRAME_HEADER.pack_into(buf, start, len(buf) - start - 4)
+
+    def flush(self):
+        """
+        Writes all buffered entries to the file.
+        """
+        if not self._buf:
+            return
+        view = memoryview(self._buf)
+        try:
+            while view:
+                written = os.write(self._fd, view)
+                view = view[written:]
+        finally:
+            view.release()
+        self._buf.clear()
+        self._buffered = 0
+        self._unsynced = True
+
+    async def run_flusher(self):
+        """
+        Background task: flushes the buffer every flush_interval_s and, if
+        enabled, commits everything written so far with a single fsync.
         """
-        payload = entry.model_dump()
-        # Ensure we write a single line
-        line = json.dumps(payload) + "\n"
-        self._file.write(line)
-        # Flush handled by buffering=1 for newlines, but can force if critical
-        # self._file.flush()
+        while True:
+            await asyncio.sleep(self.flush_interval_s)
+            self.flush()
+            if self.fsync and self._unsynced:
+                self._unsynced = False
+                fd = self._fd
+                try:
+                    await asyncio.to_thread(os.fsync, fd)
+                except OSError:
+                    if self._fd == fd:
+                        raise
+                    # Closed under us; close() already did the final fsync
 
     def close(self):
-        self._file.close()
+        if self._fd < 0:
+            return
+        self.flush()
+        if self.fsync and self._unsynced:
+            os.fsync(self._fd)
+            self._unsynced = False
+        os.close(self._fd)
+        self._fd = -1
 
     @staticmethod
     def replay(filepath: str):
         """
         Generator to replay entries from a journal file.
+        Entries are trusted (written by append()), so records are decoded with
+        orjson/msgspec and the model is built without re-validation.
         """
-        with open(filepath, "r") as f:
-            for line in f:
-                if line.strip():
-                    yield JournalEntry.model_validate_json(line)
+        construct = JournalEntry.model_construct
+        for record in read_records(filepath):
+            yield construct(**record)
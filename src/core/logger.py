@@ -1,21 +1,34 @@
 import sys
+import orjson
 import structlog
 import logging
 
+_stack_info_renderer = structlog.processors.StackInfoRenderer()
+
+def _stack_info_on_error(logger, method_name: str, event_dict: dict) -> dict:
+    """
+    Renders stack_info only for error-level events; keeps it off the hot path.
+    """
+    if method_name in ("error", "critical", "exception"):
+        return _stack_info_renderer(logger, method_name, event_dict)
+    event_dict.pop("stack_info", None)
+    return event_dict
+
 def configure_logging(log_level: str = "INFO"):
     """
     Configures structlog to output JSON logs to stdout.
+    Rendered with orjson straight to bytes on sys.stdout.buffer.
     """
     structlog.configure(
         processors=[
             structlog.contextvars.merge_contextvars,
             structlog.processors.add_log_level,
-            structlog.processors.StackInfoRenderer(),
+            _stack_info_on_error,
             structlog.processors.format_exc_info,
             structlog.processors.TimeStamper(fmt="iso"),
-            structlog.processors.JSONRenderer()
+            structlog.processors.JSONRenderer(serializer=orjson.dumps)
         ],
-        logger_factory=structlog.PrintLoggerFactory(),
+        logger_factory=structlog.BytesLoggerFactory(),
         wrapper_class=structlog.make_filtering_bound_logger(logging.getLevelName(log_level)),
         cache_logger_on_first_use=True,
     )
@@ -0,0 +1,120 @@
+import asyncio
+from collections import deque
+from typing import Any, Deque, List, Optional
+
+class PacketRing:
+    """
+    Bounded FIFO between the exchange ingest tasks and the packet consumer.
+
+    A preallocated slot array indexed by two monotonic counters: producers only
+    advance the write index, the single consumer only advances the read index.
+    Everything runs on the event loop thread, so no locks or atomics are needed;
+    futures are only created when a side actually has to park:
+      - the consumer parks when the ring is empty and is woken by the next put,
+      - producers park when it is full (backpressure) and are woken as the
+        consumer frees slots, once per drained batch rather than per item.
+    Exposes the subset of the asyncio.Queue API the observer uses.
+    """
+    def __init__(self, maxsize: int):
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+        self.maxsize = maxsize
+        self._slots: List[Any] = [None] * maxsize
+        self._read = 0 # next slot to read (monotonic)
+        self._write = 0 # next slot to write (monotonic)
+        self._getter: Optional[asyncio.Future] = None
+        self._putters: Deque[asyncio.Future] = deque()
+
+    def qsize(self) -> int:
+        return self._write - self._read
+
+    def empty(self) -> bool:
+        return self._write == self._read
+
+    def full(self) -> bool:
+        return self._write - self._read >= self.maxsize
+
+    def put_nowait(self, item: Any):
+        write = self._write
+        if write - self._read >= self.maxsize:
+            raise asyncio.QueueFull
+        self._slots[write % self.maxsize] = item
+        self._write = write + 1
+        getter = self._getter
+        if getter is not None:
+            self._getter = None
+            if not getter.done():
+                getter.set_result(None)
+
+    async def put(self, item: Any):
+        while self._write - self._read >= self.maxsize:
+            putter = asyncio.get_running_loop().create_future()
+            self._putters.append(putter)
+            try:
+                await putter
+            except BaseException:
+                putter.cancel()
+                try:
+                    self._putters.remove(putter)
+                except ValueError:
+                    # Already woken: pass the freed slot on to the next producer
+                    if not self.full():
+                        self._wake_putters(1)
+                raise
+        self.put_nowait(item)
+
+    def get_nowait(self) -> Any:
+        read = self._read
+        if read == self._write:
+            raise asyncio.QueueEmpty
+        index = read % self.maxsize
+        item = self._slots[index]
+        self._slots[index] = None
+        self._read = read + 1
+        if self._putters:
+            self._wake_putters(1)
+        return item
+
+    async def get(self) -> Any:
+        await self._wait_not_empty()
+        return self.get_nowait()
+
+    async def get_batch(self, max_items: int) -> List[Any]:
+        """
+        Waits until at least one item is available, then drains up to
+        max_items in one pass.
+        """
+        await self._wait_not_empty()
+        read = self._read
+        count = min(self._write - read, max_items)
+        slots = self._slots
+        size = self.maxsize
+        batch = []
+        append = batch.append
+        for i in range(read, read + count):
+            index = i % size
+            append(slots[index])
+            slots[index] = None
+        self._read = read + count
+        if self._putters:
+            self._wake_putters(count)
+        return batch
+
+    async def _wait_not_empty(self):
+        # Single consumer: at most one parked getter at a time
+        while self._read == self._write:
+            getter = asyncio.get_running_loop().create_future()
+            self._getter = getter
+            try:
+                await getter
+            finally:
+                if self._getter is getter:
+                    self._getter = None
+
+    def _wake_putters(self, n: int):
+        putters = self._putters
+        while n and putters:
+            putter = putters.popleft()
+            if not putter.done():
+                putter.set_result(None)
+                n -= 1
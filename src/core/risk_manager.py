@@ -2,3 +2,12 @@ class RiskManager:
     def __init__(self):
         # Implementation of stop-loss, position sizing, etc.
         pass
+
+    def stateless_key(self, symbol, signal):
+        """
+        Hashable key such that validate_trade(symbol, signal) depends only on
+        (symbol, signal, key), e.g. the current exposure bucket; strategies
+        then cache validate_trade per key. None means no caching.
+        Call strategies.base_strategy.invalidate_risk_cache() when limits change.
+        """
+        return None
@@ -1,56 +1,134 @@
+import asyncio
 import json
 import redis
-import statistics
-from typing import List, Optional
+import numpy as np
+from typing import List, Optional, Sequence
 from .types import DriftStats, SystemState
 from .clock import Clock
 
+# Drift batches at least this long use the vectorized path in update_drift_batch
+DRIFT_VECTOR_MIN_BATCH = 32
+
 class ObserverState:
     """
     Manages the authoritative state of the Observer system.
     Backed by Redis, with local caching for read-heavy operations.
     """
-    def __init__(self, redis_url: str = "redis://localhost:6379/0"):
+    def __init__(self, redis_url: str = "redis://localhost:6379/0", max_drift_samples: int = 50):
         self.redis = redis.from_url(redis_url, decode_responses=True)
-        self.drift_samples: List[int] = []
+        self.max_drift_samples = max_drift_samples
+        # Drift window: preallocated int64 ring buffer (no per-sample Python objects)
+        self._drift_buf = np.zeros(max_drift_samples, dtype=np.int64)
+        self._drift_pos = 0 # next slot to write
+        self._drift_count = 0
+        # Running sums over the drift window (see update_drift)
+        self._sum_y = 0
+        self._sum_xy = 0
+        # Gaps recorded since the last flush_counters()
+        self._pending_gaps = 0
         self._local_cache: Optional[SystemState] = None
-        self.max_drift_samples = 50
 
     def update_drift(self, drift_us: int) -> DriftStats:
         """
-        Updates rolling drift statistics.
+        Updates rolling drift statistics in O(1).
+
+        Keeps running integer sums of y and x*y over the window, where x is the
+        sample's index in the window. Sums over x are closed-form in n.
         """
-        self.drift_samples.append(drift_us)
-        if len(self.drift_samples) > self.max_drift_samples:
-            self.drift_samples.pop(0)
+        self._push_drift(drift_us)
 
-        mean_val = statistics.mean(self.drift_samples) if self.drift_samples else 0.0
-        
-        # Simple slope calculation (linear regression on the window)
+        n = self._drift_count
+        mean_val = self._sum_y / n
+
+        # Least-squares slope of drift vs window index
         slope_val = 0.0
-        if len(self.drift_samples) > 1:
-            # x is just index, y is drift
-            x = list(range(len(self.drift_samples)))
-            try:
-                # Basic linear regression slope
-                slope_val = statistics.linear_regression(x, self.drift_samples).slope
-            except AttributeError:
-                # Fallback for older python versions without linear_regression
-                # Calculate slope manually if needed or ignore
-                pass
-
-        stats = DriftStats(mean_us=mean_val, slope=slope_val, sample_count=len(self.drift_samples))
+        if n > 1:
+            sum_x = n * (n - 1) // 2
+            sum_xx = (n - 1) * n * (2 * n - 1) // 6
+            slope_val = (n * self._sum_xy - sum_x * self._sum_y) / (n * sum_xx - sum_x * sum_x)
+
+        stats = DriftStats(mean_us=mean_val, slope=slope_val, sample_count=n)
         
         # Persist stats to Redis? Optional, maybe just keep in memory for high freq
         # For now, we update the authoritative state periodically or on significant change
         return stats
 
+    def _push_drift(self, drift_us: int):
+        """Adds one sample to the window and the running sums."""
+        buf = self._drift_buf
+        pos = self._drift_pos
+        x_new = self._drift_count
+        if x_new == self.max_drift_samples:
+            # Evict the oldest sample (x=0, about to be overwritten at pos),
+            # then every remaining x shifts down by one
+            self._sum_y -= int(buf[pos])
+            self._sum_xy -= self._sum_y
+            x_new -= 1
+        else:
+            self._drift_count += 1
+        self._sum_xy += x_new * drift_us
+        self._sum_y += drift_us
+        buf[pos] = drift_us
+        pos += 1
+        self._drift_pos = 0 if pos == self.max_drift_samples else pos
+
+    def update_drift_batch(self, drifts: Sequence[int]) -> List[float]:
+        """
+        Adds a batch of drift samples.
+
+        Returns the rolling mean after each sample, i.e. the mean_us that
+        update_drift() would have reported for it. The window and running sums
+        end up exactly as after the equivalent update_drift() calls.
+        Batches shorter than DRIFT_VECTOR_MIN_BATCH go through the O(1)
+        running sums one sample at a time (numpy's fixed per-call cost
+        dominates there); longer ones take one vectorized pass, a cumulative
+        sum over the previous window followed by the batch.
+        """
+        if len(drifts) < DRIFT_VECTOR_MIN_BATCH:
+            push = self._push_drift
+            means = []
+            for drift_us in drifts:
+                push(drift_us)
+                means.append(self._sum_y / self._drift_count)
+            return means
+
+        new = np.asarray(drifts, dtype=np.int64)
+        size = self.max_drift_samples
+        seq = np.concatenate((self.drift_window(), new))
+        csum = np.zeros(len(seq) + 1, dtype=np.int64)
+        np.cumsum(seq, out=csum[1:])
+        ends = np.arange(len(seq) - len(new) + 1, len(seq) + 1)
+        starts = np.maximum(ends - size, 0)
+        means = (csum[ends] - csum[starts]) / (ends - starts)
+
+        # New window = last `size` samples, stored oldest-first from slot 0
+        window = seq[-size:]
+        n = len(window)
+        self._drift_buf[:n] = window
+        self._drift_count = n
+        self._drift_pos = 0 if n == size else n
+        self._sum_y = int(window.sum())
+        self._sum_xy = int(np.dot(np.arange(n, dtype=np.int64), window))
+        return means.tolist()
+
+    def drift_window(self) -> np.ndarray:
+        """
+        Returns a copy of the current drift window, oldest sample first.
+        For on-demand vectorized analysis; update_drift() does not need it.
+        """
+        if self._drift_count < self.max_drift_samples:
+            return self._drift_buf[:self._drift_count].copy()
+        return np.roll(self._drift_buf, -self._drift_pos)
+
     def set_system_status(self, status: str):
         """
         Updates the global system status in Redis.
+        Single MSET: one round-trip, and both keys change together.
         """
-        self.redis.set("observer:status", status)
-        self.redis.set("observer:last_update", Clock.now_us())
+        self.redis.mset({
+            "observer:status": status,
+            "observer:last_update": Clock.now_us(),
+        })
 
     def get_system_status(self) -> str:
         """
@@ -60,9 +138,26 @@ class ObserverState:
 
     def record_gap(self):
         """
-        Increments the gap counter in Redis.
+        Counts a gap locally. Pushed to Redis by flush_counters().
+        """
+        self._pending_gaps += 1
+
+    def flush_counters(self):
+        """
+        Pushes locally accumulated counters to Redis in a single INCRBY.
+        """
+        pending = self._pending_gaps
+        if pending:
+            self._pending_gaps = 0
+            self.redis.incrby("observer:gap_count", pending)
+
+    async def run_counter_flusher(self, interval_s: float = 0.1):
+        """
+        Background task: flushes counters every interval_s.
         """
-        self.redis.incr("observer:gap_count")
+        while True:
+            await asyncio.sleep(interval_s)
+            self.flush_counters()
 
     def get_gap_count(self) -> int:
-        return int(self.redis.get("observer:gap_count") or 0)
+        return int(self.redis.get("observer:gap_count") or 0) + self._pending_gaps
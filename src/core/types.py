@@ -1,13 +1,16 @@
-from typing import Literal, Optional, Dict, Any
+from typing import Literal, Optional, Dict, Any, Callable
+import msgspec
 from pydantic import BaseModel, Field
 
 # Constants
 MICROSECONDS_PER_SECOND = 1_000_000
 
-class Packet(BaseModel):
+class Packet(msgspec.Struct, frozen=True):
     """
     Standardized internal packet format.
     Immutable once created.
+    Allocated per exchange event, so it is a slotted msgspec Struct rather than a
+    pydantic model: no validation on construction, producers pass typed values.
     """
     exchange_ts: int  # Canonical exchange timestamp in microseconds
     local_arrival_ts: int # Local monotonic timestamp in microseconds
@@ -37,7 +40,7 @@ class SystemState(BaseModel):
 
 # --- Phase 2: Gatekeeper Types ---
 
-from enum import Enum
+from enum import Enum, IntEnum
 
 class OrderSide(str, Enum):
     BUY = "BUY"
@@ -52,9 +55,14 @@ class TimeInForce(str, Enum):
     IOC = "IOC"
     FOK = "FOK"
 
-class OrderIntent(BaseModel):
+class OrderIntent(msgspec.Struct, frozen=True, kw_only=True):
     """
-    Intent to place an order. Guaranteed immutable by policy.
+    Intent to place an order. Immutable (frozen).
+    Created per order on the submit path, so like Packet it is a slotted
+    msgspec Struct. It is the Gatekeeper's entry point from strategies, so
+    unlike Packet its fields are checked on construction: enum values are
+    coerced in place (e.g. "BUY" -> OrderSide.BUY), ints are accepted as
+    floats, and anything else invalid raises msgspec.ValidationError.
     """
     client_order_id: str
     symbol: str
@@ -65,6 +73,50 @@ class OrderIntent(BaseModel):
     time_in_force: TimeInForce = TimeInForce.GTC
     timestamp: int # local creation time
 
+    def __post_init__(self):
+        # Direct type checks: a full msgspec.convert() of the struct costs
+        # several times the construction itself. Typed input (the usual case)
+        # only pays for the checks.
+        if (
+            self.client_order_id.__class__ is not str
+            or self.symbol.__class__ is not str
+            or self.timestamp.__class__ is not int
+        ):
+            raise msgspec.ValidationError(
+                "Invalid OrderIntent: client_order_id and symbol must be str, timestamp int"
+            )
+        if self.side.__class__ is not OrderSide:
+            _coerce(self, "side", _ENUM_VALUES[OrderSide].get)
+        if self.order_type.__class__ is not OrderType:
+            _coerce(self, "order_type", _ENUM_VALUES[OrderType].get)
+        if self.time_in_force.__class__ is not TimeInForce:
+            _coerce(self, "time_in_force", _ENUM_VALUES[TimeInForce].get)
+        if self.quantity.__class__ is not float:
+            _coerce(self, "quantity", _int_to_float)
+        if self.price is not None and self.price.__class__ is not float:
+            _coerce(self, "price", _int_to_float)
+
+# Enum value -> member, for coercing plain strings
+_ENUM_VALUES = {
+    enum_type: {member.value: member for member in enum_type}
+    for enum_type in (OrderSide, OrderType, TimeInForce)
+}
+
+def _int_to_float(value: Any) -> Optional[float]:
+    # bool is excluded by the exact class check
+    return float(value) if value.__class__ is int else None
+
+def _coerce(intent: OrderIntent, name: str, convert: Callable[[Any], Any]):
+    """Replaces a field with convert(value); None from convert means invalid."""
+    value = getattr(intent, name)
+    try:
+        coerced = convert(value)
+    except TypeError: # unhashable
+        coerced = None
+    if coerced is None:
+        raise msgspec.ValidationError(f"Invalid OrderIntent: {name}={value!r}")
+    msgspec.structs.force_setattr(intent, name, coerced)
+
 class ExecutionReport(BaseModel):
     """
     Truth from the exchange. Logic triggers on this.
@@ -79,3 +131,13 @@ class ExecutionReport(BaseModel):
     remaining_quantity: float
     timestamp: int # Exchange timestamp
 
+# --- Strategy Types ---
+
+class Signal(IntEnum):
+    """
+    Strategy decision. Integer-valued so hot-path checks are int compares;
+    HOLD is 0 (falsy), so `if signal:` means "act on it".
+    """
+    HOLD = 0
+    BUY = 1
+    SELL = -1
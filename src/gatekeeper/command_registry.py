@@ -1,4 +1,5 @@
-from typing import Dict, Optional
+from collections import OrderedDict
+from typing import Optional, Set
 from ..core.types import OrderIntent
 
 class CommandRegistry:
@@ -6,20 +7,34 @@ class CommandRegistry:
     Ensures Idempotency.
     Registry of ClientOrderIDs.
     """
-    def __init__(self):
+    def __init__(self, max_recent: int = 10_000):
         # In-memory for now, could be Redis-backed for persistence across restarts
-        self._orders: Dict[str, OrderIntent] = {}
+        # Every ClientOrderID ever seen (idempotency needs only membership).
+        # A plain set: the str hash is cached on the object and the probe is a
+        # single C call, which a Python-level prefilter (e.g. a Bloom filter)
+        # cannot beat, and a new ID has to be added here anyway.
+        self._seen: Set[str] = set()
+        # Most recent intents for get(), capped at max_recent (oldest evicted first)
+        self._recent: "OrderedDict[str, OrderIntent]" = OrderedDict()
+        self.max_recent = max_recent
 
     def register(self, intent: OrderIntent) -> bool:
         """
-        Registers an intent. 
+        Registers an intent.
         Returns True if new, False if duplicate.
         """
-        if intent.client_order_id in self._orders:
+        cloid = intent.client_order_id
+        if cloid in self._seen:
             return False
-        
-        self._orders[intent.client_order_id] = intent
+
+        self._seen.add(cloid)
+        self._recent[cloid] = intent
+        if len(self._recent) > self.max_recent:
+            self._recent.popitem(last=False)
         return True
 
     def get(self, client_order_id: str) -> Optional[OrderIntent]:
-        return self._orders.get(client_order_id)
+        """
+        Returns the intent if it is among the max_recent most recently registered.
+        """
+        return self._recent.get(client_order_id)
@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import List, Optional, Tuple
 import redis
 from .rate_limiter import TokenBucket
 from ..core.clock import Clock
@@ -15,6 +15,21 @@ class ExecutionGuard:
         self.redis = redis.from_url(redis_url, decode_responses=True)
         self.rate_limiter = TokenBucket(rate=10.0, capacity=50.0) # 10 orders/sec
         self.in_safe_mode = False
+        # Cached (status, last_update) from the Observer, refreshed via MGET
+        self.status_cache_ttl_us = 50_000 # 50ms, well inside the 2s heartbeat tolerance
+        self._status_cache: Optional[Tuple[Optional[str], Optional[str]]] = None
+        self._status_cache_ts = 0
+
+    def _observer_status(self, now: int) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Returns (observer:status, observer:last_update), fetched with a single
+        MGET and reused for status_cache_ttl_us.
+        """
+        if self._status_cache is None or (now - self._status_cache_ts) >= self.status_cache_ttl_us:
+            status, last_update = self.redis.mget("observer:status", "observer:last_update")
+            self._status_cache = (status, last_update)
+            self._status_cache_ts = now
+        return self._status_cache
 
     def validate_intent(self) -> bool:
         """
@@ -24,14 +39,15 @@ class ExecutionGuard:
         if self.in_safe_mode:
             raise RuntimeError("HARD_BLOCK: System in SAFE_MODE")
 
+        now = Clock.now_us()
+        status, last_update = self._observer_status(now)
+
         # 2. Check Phase 1 Connectivity
-        status = self.redis.get("observer:status")
         if status != "CONNECTED":
             raise RuntimeError(f"HARD_BLOCK: Observer status is {status}")
 
         # 3. Check Heartbeat (Last update from Observer)
-        last_seen = int(self.redis.get("observer:last_update") or 0)
-        now = Clock.now_us()
+        last_seen = int(last_update or 0)
         if (now - last_seen) > 2_000_000: # 2 seconds tolerance
             raise RuntimeError(f"HARD_BLOCK: Observer heartbeat stale (>2s)")
 
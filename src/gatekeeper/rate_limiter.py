@@ -1,4 +1,12 @@
-from ..core.clock import Clock
+from time import monotonic_ns
+
+# Token amounts are fixed-point integers in units of 1e-12 token; the rate is
+# kept in those units per second (exact for any rate with up to 12 decimals).
+# Refill over an interval of nanoseconds is rate * elapsed_ns / 1e9, computed
+# with divmod and the sub-unit remainder carried to the next call, so refill
+# never loses time and consume() is pure integer arithmetic.
+TOKEN_SCALE = 10**12
+NS_PER_SECOND = 1_000_000_000
 
 class TokenBucket:
     """
@@ -11,24 +19,36 @@ class TokenBucket:
         """
         self.rate = rate
         self.capacity = capacity
-        self.tokens = capacity
-        self.last_update_ts = Clock.now_us()
+        self._rate_scaled = round(rate * TOKEN_SCALE)
+        self._capacity_scaled = round(capacity * TOKEN_SCALE)
+        self._tokens_scaled = self._capacity_scaled
+        self._refill_remainder = 0 # token units * ns not yet credited
+        self._last_ns = monotonic_ns()
+
+    @property
+    def tokens(self) -> float:
+        """Currently available tokens (as of the last consume)."""
+        return self._tokens_scaled / TOKEN_SCALE
 
     def consume(self, tokens: float = 1.0) -> bool:
         """
         Attempts to consume tokens. Returns True if allowed.
         """
-        now = Clock.now_us()
-        
+        now = monotonic_ns()
+
         # Refill
-        # duration in seconds
-        delta_seconds = (now - self.last_update_ts) / 1_000_000.0
-        new_tokens = delta_seconds * self.rate
-        
-        self.tokens = min(self.capacity, self.tokens + new_tokens)
-        self.last_update_ts = now
+        gained, self._refill_remainder = divmod(
+            (now - self._last_ns) * self._rate_scaled + self._refill_remainder, NS_PER_SECOND
+        )
+        available = self._tokens_scaled + gained
+        if available >= self._capacity_scaled:
+            available = self._capacity_scaled
+            self._refill_remainder = 0
+        self._last_ns = now
 
-        if self.tokens >= tokens:
-            self.tokens -= tokens
+        cost = round(tokens * TOKEN_SCALE)
+        if available >= cost:
+            self._tokens_scaled = available - cost
             return True
+        self._tokens_scaled = available
         return False
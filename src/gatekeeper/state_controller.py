@@ -1,5 +1,6 @@
 from typing import Dict, Optional, Any
 import redis
+from redis.client import Pipeline
 from ..core.types import ExecutionReport, OrderIntent
 from ..core.logger import get_logger
 
@@ -11,7 +12,7 @@ class StateController:
     Strictly follows: Mutation ONLY on ExecutionReport.
     """
     def __init__(self, redis_url: str):
-        self.redis = redis.from_url(redis_url, decode_responses=True)
+        self.redis = redis.from_url(redis_url, decode_responses=True, socket_keepalive=True)
         # Using a distinct prefix for Gatekeeper owned state
         self.PREFIX_POS = "gk:positions"
         self.PREFIX_ORDER = "gk:orders"
@@ -19,29 +20,33 @@ class StateController:
     def process_execution_report(self, report: ExecutionReport):
         """
         The ONLY entry point for state mutation.
+        Order and position writes go out in a single pipeline round-trip.
         """
-        self._update_order_state(report)
+        pipe = self.redis.pipeline(transaction=False)
+        self._update_order_state(report, pipe)
         
         if report.status in ["PARTIAL_FILL", "FILLED"]:
-            self._update_position(report)
+            self._update_position(report, pipe)
+
+        pipe.execute()
             
         logger.info("state_updated", 
                     client_order_id=report.client_order_id, 
                     status=report.status,
                     filled_qty=report.filled_quantity)
 
-    def _update_order_state(self, report: ExecutionReport):
+    def _update_order_state(self, report: ExecutionReport, pipe: Pipeline):
         """
-        Updates order status in Redis.
+        Queues the order status update on the pipeline.
         """
         key = f"{self.PREFIX_ORDER}:{report.client_order_id}"
         # We store the latest report or a consolidated state
-        # For simple KV, just dumping the json
-        self.redis.set(key, report.model_dump_json())
+        # For simple KV, just dumping the json (as bytes, straight from the pydantic serializer)
+        pipe.set(key, report.__pydantic_serializer__.to_json(report))
 
-    def _update_position(self, report: ExecutionReport):
+    def _update_position(self, report: ExecutionReport, pipe: Pipeline):
         """
-        Updates position based on fills.
+        Queues the position update based on fills.
         Atomic INCRBYFLOAT equivalent behavior needed.
         """
         key = f"{self.PREFIX_POS}:{report.symbol}"
@@ -49,7 +54,7 @@ class StateController:
         signed_qty = report.filled_quantity if report.side == "BUY" else -report.filled_quantity
         
         # Redis incrbyfloat is suitable here
-        self.redis.incrbyfloat(key, signed_qty)
+        pipe.incrbyfloat(key, signed_qty)
 
     def get_position(self, symbol: str) -> float:
         val = self.redis.get(f"{self.PREFIX_POS}:{symbol}")
@@ -77,6 +77,9 @@ class BinanceObserver(ExchangeInterface):
         
         # Audit Requirement: Time Base Alignment
         drift = Clock.calculate_drift(exchange_ts_us, local_ts)
+
+        # CCXT gives the trade ID as a string; Packet.sequence_id is an int
+        trade_id = data.get('id')
         
         return Packet(
             exchange_ts=exchange_ts_us,
@@ -85,7 +88,7 @@ class BinanceObserver(ExchangeInterface):
             source="binance_ccxt",
             topic=topic,
             payload=data,
-            sequence_id=data.get('id') # Trade ID
+            sequence_id=int(trade_id) if trade_id is not None else None # Trade ID
         )
 
     async def close(self):
@@ -1,12 +1,13 @@
 import asyncio
 import signal
 import sys
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 from .core.clock import Clock
 from .core.state import ObserverState
 from .core.journal import RawJournal
-from .core.logger import list_logger, configure_logging, get_logger
-from .core.types import JournalEntry, Packet
+from .core.ring import PacketRing
+from .core.logger import configure_logging, get_logger
+from .core.types import JournalEntry
 from .markets.exchange_interface import ExchangeInterface
 from .markets.binance_observer import BinanceObserver
 from .markets.kite_observer import KiteObserver
@@ -15,16 +16,28 @@ from .markets.kite_observer import KiteObserver
 configure_logging()
 logger = get_logger("ObserverMain")
 
+# Max packets processed per wake-up of the consumer
+MAX_BATCH = 256
+
 class ObserverSystem:
-    def __init__(self):
+    def __init__(self, queue_maxsize: int = 10_000):
         self.state = ObserverState()
         self.journal = RawJournal()
         self.running = True
         self.exchanges: List[ExchangeInterface] = []
-        self.packet_queue: asyncio.Queue[Packet] = asyncio.Queue()
+        # Bounded: when the consumer stalls, producers await put() (backpressure)
+        self.packet_queue = PacketRing(queue_maxsize)
+        # Depth gauge: warn at >= 80% full, re-arm once back below 50%
+        self.queue_high_water = queue_maxsize * 8 // 10
+        self.queue_low_water = queue_maxsize // 2
+        self._queue_high_water_warned = False
+        # Write-through copy of the Redis status; _transition_status is its only writer
+        self._last_known_status = "CONNECTED"
         
         # Sequence tracking: {source_topic: last_sequence_id}
         self.sequence_tracker: Dict[str, int] = {}
+        # Interned "source:topic" keys, built once per stream
+        self._key_cache: Dict[Tuple[str, str], str] = {}
 
     async def start(self):
         logger.info("system_startup", version="phase-1-observer")
@@ -44,6 +57,12 @@ class ObserverSystem:
         # Start Consumer
         consumer = asyncio.create_task(self._process_loop())
 
+        # Start Journal Flusher (batched writes; final flush happens in journal.close())
+        journal_flusher = asyncio.create_task(self.journal.run_flusher())
+
+        # Start Redis counter flusher (gap counts are batched locally)
+        counter_flusher = asyncio.create_task(self.state.run_counter_flusher())
+
         # Signal Handling
         loop = asyncio.get_running_loop()
         for sig in (signal.SIGINT, signal.SIGTERM):
@@ -54,11 +73,13 @@ class ObserverSystem:
         try:
             # If any producer fails (raises exception), gather will raise immediately 
             # (if we don't return_exceptions=True). We want to fail loudly.
-            await asyncio.gather(*producers, consumer)
+            # The flushers are supervised too: a failed write/fsync must HALT,
+            # not leave appends piling up unsynced.
+            await asyncio.gather(*producers, consumer, journal_flusher, counter_flusher)
         except asyncio.CancelledError:
             logger.info("tasks_cancelled")
         except Exception as e:
-            # Catch producer failures (e.g. Binance stream died)
+            # Catch producer or flusher failures (e.g. Binance stream died, fsync failed)
             logger.critical("system_critical_failure", error=str(e))
             self._transition_status("HALT", "Critical Failure: " + str(e), {"error": str(e)})
         finally:
@@ -71,6 +92,7 @@ class ObserverSystem:
         """
         # 1. Update Redis
         self.state.set_system_status(new_status)
+        self._last_known_status = new_status
         
         # 2. Journal
         entry = JournalEntry(
@@ -96,76 +118,89 @@ class ObserverSystem:
             
             # Audit Requirement: Journal Atomicity (Write-ahead)
             # We journal BEFORE queuing. If we crash after this, the event is recorded.
-            entry = JournalEntry(
-                event_type="PACKET",
-                timestamp=packet.local_arrival_ts,
-                data=packet.model_dump()
-            )
-            self.journal.append(entry)
+            # Trusted internal data: the struct is encoded straight into the journal buffer.
+            self.journal.append_packet(packet.local_arrival_ts, packet)
 
             await self.packet_queue.put(packet)
 
+            depth = self.packet_queue.qsize()
+            if depth >= self.queue_high_water:
+                if not self._queue_high_water_warned:
+                    self._queue_high_water_warned = True
+                    logger.warning("packet_queue_high_water",
+                                   depth=depth,
+                                   maxsize=self.packet_queue.maxsize)
+            elif self._queue_high_water_warned and depth < self.queue_low_water:
+                self._queue_high_water_warned = False
+                logger.info("packet_queue_recovered", depth=depth)
+
     async def _process_loop(self):
         """
         Main Event Loop: Pops from queue, logs, updates state.
         """
-        logger.info("processing_loop_started")
+        # Resolve the lazy module-level proxy once; reused for every packet below
+        pkt_log = logger.bind()
+        pkt_log.info("processing_loop_started")
+        queue = self.packet_queue
+        key_cache = self._key_cache
         while self.running:
-            packet = await self.packet_queue.get()
-            
-            # 1. Sequence & Gap Detection
-            # Audit Requirement: Sequence & Gap Detection
-            key = f"{packet.source}:{packet.topic}"
-            if packet.sequence_id is not None:
-                # Assuming sequence_id is int for trade IDs in this context
-                # If it's str, we might need parsing. Binance trade ID is int.
-                try:
-                    seq_id = int(packet.sequence_id)
+            # Park until a packet arrives, then drain whatever else is already
+            # queued (up to MAX_BATCH) without a scheduler round-trip per packet.
+            batch = await queue.get_batch(MAX_BATCH)
+
+            # Rolling drift mean after each packet, computed for the whole batch at once
+            means = self.state.update_drift_batch([packet.drift_us for packet in batch])
+
+            for packet, mean_us in zip(batch, means):
+                # 1. Sequence & Gap Detection
+                # Audit Requirement: Sequence & Gap Detection
+                stream = (packet.source, packet.topic)
+                key = key_cache.get(stream)
+                if key is None:
+                    key = key_cache[stream] = sys.intern(f"{packet.source}:{packet.topic}")
+                # sequence_id is already Optional[int] (normalized by the exchange observer)
+                seq_id = packet.sequence_id
+                if seq_id is not None:
                     last_seq = self.sequence_tracker.get(key)
-                    
+                
                     if last_seq is not None:
                         expected = last_seq + 1
                         if seq_id > expected:
                             gap_size = seq_id - expected
                             msg = f"Sequence Gap: Expected {expected}, Got {seq_id}"
-                            logger.error("sequence_gap_detected", source=key, gap=gap_size)
-                            
+                            pkt_log.error("sequence_gap_detected", source=key, gap=gap_size)
+                        
                             # Journal GAP
                             self.journal.append(JournalEntry(
                                 event_type="GAP",
                                 timestamp=Clock.now_epoch_us(),
                                 data={"source": key, "expected": expected, "got": seq_id}
                             ))
-                            
+                        
                             # Transition to DEGRADED
                             self.state.record_gap()
-                            current_status = self.state.get_system_status()
-                            if current_status == "CONNECTED":
+                            if self._last_known_status == "CONNECTED":
                                 self._transition_status("DEGRADED", msg, {"gap": gap_size})
 
                         elif seq_id < last_seq:
                             # Out of order or duplicate?
-                            logger.warning("out_of_order_packet", source=key, seq=seq_id, last=last_seq)
-                    
+                            pkt_log.warning("out_of_order_packet", source=key, seq=seq_id, last=last_seq)
+                
                     self.sequence_tracker[key] = seq_id
-                except ValueError:
-                    pass # Non-integer sequence ID, skip check for now
 
-            # 2. Update State (Redis)
-            stats = self.state.update_drift(packet.drift_us)
+                # 2. Check Constraints (drift state already updated for the batch)
+                if abs(mean_us) > 500_000: # 500ms
+                    pkt_log.error("SYSTEM_HALT_DRIFT_VIOLATION", mean_drift_us=mean_us)
+                    self._transition_status("HALT", "Drift Violation", {"mean_drift_us": mean_us})
             
-            # 3. Check Constraints
-            if abs(stats.mean_us) > 500_000: # 500ms
-                logger.error("SYSTEM_HALT_DRIFT_VIOLATION", mean_drift_us=stats.mean_us)
-                self._transition_status("HALT", "Drift Violation", {"mean_drift_us": stats.mean_us})
-            
-            # 4. Emit Structured Log
-            logger.info("packet_processed", 
-                        drift_us=packet.drift_us, 
-                        source=packet.source,
-                        rolling_mean_drift=stats.mean_us)
-            
-            self.packet_queue.task_done()
+                # 3. Emit Structured Log
+                pkt_log.info("packet_processed", 
+                             drift_us=packet.drift_us, 
+                             source=packet.source,
+                             rolling_mean_drift=mean_us)
+
+            # Yield so producers run even when the queue never drains
+            await asyncio.sleep(0)
 
     async def shutdown(self, sig):
         if not self.running:
@@ -178,6 +213,7 @@ class ObserverSystem:
         for ex in self.exchanges:
             await ex.close()
         
+        self.state.flush_counters()
         self.journal.close()
         
         # Cancel all tasks? 
@@ -185,8 +221,18 @@ class ObserverSystem:
         [t.cancel() for t in tasks]
         logger.info("shutdown_complete")
 
+def _run(coro):
+    """
+    Runs the observer on uvloop when installed (Linux/macOS), else on stock asyncio.
+    """
+    try:
+        import uvloop
+    except ImportError: # e.g. Windows
+        return asyncio.run(coro)
+    return uvloop.run(coro)
+
 if __name__ == "__main__":
     try:
-        sys.exit(asyncio.run(ObserverSystem().start()))
+        sys.exit(_run(ObserverSystem().start()))
     except KeyboardInterrupt:
         pass
@@ -7,10 +7,14 @@ Runs headless and unattended.
 import sys
 import json
 import argparse
+import dataclasses
 from .context import SimulatorConfig, init_decimal_context
 from .replay_engine import ReplayEngine
 from .verdict import VerdictStatus
 
+# Checkpoint spacing of the hash log in --fast-mode
+FAST_MODE_HASH_INTERVAL = 1000
+
 def main():
     parser = argparse.ArgumentParser(
         description="OmniTrade Deterministic Simulator"
@@ -34,6 +38,21 @@ def main():
         "--output-hashes",
         help="Path to save computed hash log"
     )
+    parser.add_argument(
+        "--fast-mode",
+        action="store_true",
+        help="Without --reference-hashes, record the state hash every 1000 events (and at the end) instead of after every event"
+    )
+    parser.add_argument(
+        "--parallel-verify",
+        action="store_true",
+        help="Replay first, then compare against --reference-hashes in worker processes"
+    )
+    parser.add_argument(
+        "--parallel",
+        action="store_true",
+        help="Replay journal shards in worker processes; only the final state hash is recorded and checked"
+    )
     parser.add_argument(
         "--config-hash",
         default="auto",
@@ -56,7 +75,8 @@ def main():
     config = SimulatorConfig(
         config_hash=config_hash,
         rng_seed=args.seed,
-        journal_path=args.journal
+        journal_path=args.journal,
+        hash_interval=FAST_MODE_HASH_INTERVAL if args.fast_mode and not args.reference_hashes else 1
     )
 
     print(f"=== OmniTrade Deterministic Simulator ===")
@@ -68,14 +88,23 @@ def main():
     # Create engine
     engine = ReplayEngine(config)
 
-    # Load reference hashes if provided
-    if args.reference_hashes:
+    parallel_verify = args.parallel_verify and args.reference_hashes
+
+    # Load reference hashes if provided (after the replay in parallel mode)
+    if args.reference_hashes and not parallel_verify:
         print(f"Loading reference hashes from: {args.reference_hashes}")
         engine.load_reference_hashes(args.reference_hashes)
 
     # Run replay
     print("Starting replay...")
-    verdict = engine.run()
+    verdict = engine.run_parallel() if args.parallel else engine.run()
+
+    if parallel_verify and verdict.status == VerdictStatus.PASS:
+        print(f"Verifying against reference hashes from: {args.reference_hashes}")
+        engine.load_reference_hashes(args.reference_hashes)
+        divergence = engine.verify_hash_log_parallel()
+        if divergence:
+            verdict = dataclasses.replace(verdict, status=VerdictStatus.FAIL, divergence=divergence)
 
     # Output results
     print()
@@ -5,8 +5,9 @@ This module defines the SINGLE global execution context for the simulator.
 All decimal math, RNG, and configuration MUST flow through here.
 """
 import decimal
-import hashlib
+from hashlib import sha256 as _sha256
 import random
+import numpy as np
 from dataclasses import dataclass, field
 from typing import Dict, Any, Optional
 
@@ -38,6 +39,9 @@ class SimulatorConfig:
     rng_seed: int               # Fixed RNG seed
     journal_path: str           # Path to raw event journal
     dependency_versions: Dict[str, str] = field(default_factory=dict)
+    # Without reference hashes, record the state hash only every Nth event
+    # (plus the last one). Always 1 when verifying against a reference.
+    hash_interval: int = 1
 
     def verify_hash(self) -> bool:
         """
@@ -48,20 +52,29 @@ class SimulatorConfig:
 
     def _compute_hash(self) -> str:
         data = f"{self.rng_seed}:{self.journal_path}:{sorted(self.dependency_versions.items())}"
-        return hashlib.sha256(data.encode()).hexdigest()[:16]
+        return _sha256(data.encode(), usedforsecurity=False).hexdigest()[:16]
 
 class DeterministicRNG:
     """
     Wrapper around random.Random with explicit seed.
     Provides reproducible randomness.
+    Batch draws come from a separate NumPy PCG64 stream with the same seed
+    (bit-reproducible across platforms), so they never shift the scalar sequence.
+    Prefer randint_batch() for bulk draws (one C call per batch); the
+    per-call randint()/random()/choice() remain for existing callers.
     """
     def __init__(self, seed: int):
         self._seed = seed
         self._rng = random.Random(seed)
+        self._gen = np.random.Generator(np.random.PCG64(seed))
 
     def randint(self, a: int, b: int) -> int:
         return self._rng.randint(a, b)
 
+    def randint_batch(self, a: int, b: int, n: int) -> np.ndarray:
+        """n integers in [a, b] (inclusive, like randint) in one call."""
+        return self._gen.integers(a, b + 1, size=n, dtype=np.int64)
+
     def random(self) -> float:
         return self._rng.random()
 
@@ -0,0 +1,55 @@
+"""
+OmniTrade Simulator: Hash Log
+
+Compact event_index -> state_hash record of a replay.
+"""
+from array import array
+from collections.abc import Mapping
+from typing import Iterator
+
+_MASK64 = (1 << 64) - 1
+
+class HashLog(Mapping):
+    """
+    Read-only mapping of event index -> state hash (32 hex chars) for event
+    indices 0..size-1, filled by record().
+
+    Digests are stored as two uint64 words per event in one array('Q')
+    preallocated for the whole journal, plus a presence byte per event (the
+    log may be sparse, e.g. with hash_interval > 1). About 17 bytes per event
+    instead of a dict entry with a boxed int key and a str value; hex strings
+    are only built on access.
+    """
+    def __init__(self, size: int = 0):
+        self._words = array('Q', bytes(16 * size))
+        self._present = bytearray(size)
+        self._count = 0
+
+    def record(self, index: int, digest: int):
+        """Stores the 128-bit state digest for an event index."""
+        i = 2 * index
+        self._words[i] = digest >> 64
+        self._words[i + 1] = digest & _MASK64
+        if not self._present[index]:
+            self._present[index] = 1
+            self._count += 1
+
+    def __getitem__(self, index: int) -> str:
+        if not (isinstance(index, int) and 0 <= index < len(self._present) and self._present[index]):
+            raise KeyError(index)
+        i = 2 * index
+        return f"{self._words[i]:016x}{self._words[i + 1]:016x}"
+
+    def __contains__(self, index) -> bool:
+        return isinstance(index, int) and 0 <= index < len(self._present) and bool(self._present[index])
+
+    def __iter__(self) -> Iterator[int]:
+        """Recorded event indices, ascending."""
+        present = self._present
+        index = present.find(1)
+        while index >= 0:
+            yield index
+            index = present.find(1, index + 1)
+
+    def __len__(self) -> int:
+        return self._count
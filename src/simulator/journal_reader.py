@@ -4,29 +4,39 @@ OmniTrade Simulator: Journal Reader
 Reads the raw event journal from Phase 1 for replay.
 Enforces strict ordering rules.
 """
-import json
+import operator
+import os
+import sys
 from dataclasses import dataclass
-from typing import Iterator, List, Optional
+from typing import BinaryIO, Iterator, List, Optional, Union
 from ..core.types import JournalEntry
+from ..core.journal import read_records
 
 @dataclass
 class OrderedEvent:
     """
     Event with ordering metadata for deterministic replay.
     """
+    __slots__ = ("index", "local_arrival_ts", "sequence_id", "source_priority", "event", "_key")
+
     index: int
     local_arrival_ts: int
     sequence_id: Optional[int]
     source_priority: int  # Lower = higher priority (WS=1, REST=2)
     event: JournalEntry
 
+    def __post_init__(self):
+        # Built once; sorting/merging compare these pre-built tuples in C
+        seq = self.sequence_id if self.sequence_id is not None else 2**63
+        self._key = (self.local_arrival_ts, seq, self.source_priority, self.index)
+
     def ordering_key(self):
         """
         Returns tuple for stable sorting.
-        Order: (local_arrival_ts, sequence_id or MAX, source_priority)
+        Order: (local_arrival_ts, sequence_id or MAX, source_priority, index)
+        The journal index makes ties resolve exactly like a stable sort.
         """
-        seq = self.sequence_id if self.sequence_id is not None else 2**63
-        return (self.local_arrival_ts, seq, self.source_priority)
+        return self._key
 
 class JournalReader:
     """
@@ -41,53 +51,112 @@ class JournalReader:
     }
     DEFAULT_PRIORITY = 3
 
-    def __init__(self, journal_path: str):
+    def __init__(self, journal_path: Union[str, os.PathLike, BinaryIO]):
+        """
+        journal_path: path of the journal, or a binary stream holding a
+        JSON-lines journal (read once, on load).
+        """
         self.journal_path = journal_path
         self._events: List[OrderedEvent] = []
+        self._count = 0
 
     def load(self) -> int:
         """
         Loads all events from the journal.
         Returns the count of events loaded.
         """
-        self._events = []
+        self.load_streaming()
+        return self._count
+
+    def load_streaming(self) -> Iterator[OrderedEvent]:
+        """
+        Scans the journal once and returns an iterator over its events in
+        deterministic order. The ordered events are also kept, so __iter__,
+        get_event() and len() reflect this load as they do after load().
+
+        The producer appends in arrival order, so the journal is normally
+        already ordered: then events are yielded as read (no sort at all).
+        Otherwise the events are sorted once, in C, by ordering_key(). Ties are
+        broken by journal index (part of the key), so the result equals a
+        stable sort on the timestamp/sequence/priority rules.
+        """
+        events: List[OrderedEvent] = []
+        in_order = True
+        prev_key = None
         index = 0
         
-        with open(self.journal_path, 'r') as f:
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
-                
-                entry = JournalEntry.model_validate_json(line)
-                
-                # Extract ordering metadata from the event data
-                data = entry.data
-                local_ts = entry.timestamp
-                seq_id = data.get("sequence_id")
-                source = data.get("source", "unknown")
-                priority = self.SOURCE_PRIORITY.get(source, self.DEFAULT_PRIORITY)
-                
-                ordered = OrderedEvent(
-                    index=index,
-                    local_arrival_ts=local_ts,
-                    sequence_id=seq_id,
-                    source_priority=priority,
-                    event=entry
-                )
-                self._events.append(ordered)
-                index += 1
-        
-        # Sort by deterministic ordering rules
-        self._events.sort(key=lambda e: e.ordering_key())
-        return len(self._events)
+        # Records come straight from orjson/msgspec (JSON lines or msgpack
+        # frames); the journal was written by our own code, so entries are
+        # constructed without pydantic re-validation.
+        construct = JournalEntry.model_construct
+        intern = sys.intern
+        # Loop-invariant lookups bound once
+        priority_get = self.SOURCE_PRIORITY.get
+        default_priority = self.DEFAULT_PRIORITY
+        events_append = events.append
+        for record in read_records(self.journal_path):
+            # Interned: one shared string per event type across all loaded
+            # events, and the replay dispatch lookup compares by identity
+            record["event_type"] = intern(record["event_type"])
+            entry = construct(**record)
+            
+            # Extract ordering metadata from the event data
+            data = entry.data
+            local_ts = entry.timestamp
+            seq_id = data.get("sequence_id")
+            priority = priority_get(data.get("source", "unknown"), default_priority)
+            
+            ordered = OrderedEvent(
+                index=index,
+                local_arrival_ts=local_ts,
+                sequence_id=seq_id,
+                source_priority=priority,
+                event=entry
+            )
+            events_append(ordered)
+
+            key = ordered._key
+            if in_order and prev_key is not None and key < prev_key:
+                in_order = False
+            prev_key = key
+            index += 1
+
+        if not in_order:
+            # Deterministic ordering rules (the key is pre-built on each event)
+            events.sort(key=operator.attrgetter("_key"))
+        self._events = events
+        self._count = index
+        return iter(events)
+
+    def iter_range(self, start: int, end: int) -> Iterator[OrderedEvent]:
+        """
+        Events of one byte range of a JSON-lines journal (see
+        core.journal.split_journal), in file order and unsorted. Indices are
+        local to the range (0-based); the caller offsets them.
+        """
+        construct = JournalEntry.model_construct
+        intern = sys.intern
+        priority_get = self.SOURCE_PRIORITY.get
+        default_priority = self.DEFAULT_PRIORITY
+        for index, record in enumerate(read_records(self.journal_path, start, end)):
+            record["event_type"] = intern(record["event_type"])
+            entry = construct(**record)
+            data = entry.data
+            yield OrderedEvent(
+                index=index,
+                local_arrival_ts=entry.timestamp,
+                sequence_id=data.get("sequence_id"),
+                source_priority=priority_get(data.get("source", "unknown"), default_priority),
+                event=entry
+            )
 
     def __iter__(self) -> Iterator[OrderedEvent]:
         """Yields events in deterministic order."""
         return iter(self._events)
 
     def __len__(self) -> int:
-        return len(self._events)
+        """Number of events found by the last load()/load_streaming()."""
+        return self._count
 
     def get_event(self, index: int) -> Optional[OrderedEvent]:
         """Get event by its sorted index."""
@@ -4,14 +4,41 @@ OmniTrade Simulator: Replay Engine
 The core deterministic replay engine.
 Processes events ONE AT A TIME, synchronously.
 NO ASYNC. NO CONCURRENCY. NO PARALLELISM.
+(verify_hash_log_parallel only compares finished hash logs, after replay.
+run_parallel replays disjoint journal shards, each one event at a time, and
+merges their final states; it records no per-event hashes.)
 """
-from decimal import Decimal
-from typing import Optional, Dict, Any, List
-from .context import SimulatorConfig, DeterministicRNG, init_decimal_context
+import os
+from decimal import Decimal, localcontext
+from dataclasses import dataclass
+from multiprocessing import Pool
+from typing import Optional, Dict, Any, List, Tuple, Union, BinaryIO
+from .context import SimulatorConfig, DeterministicRNG, DECIMAL_CONTEXT
 from .journal_reader import JournalReader, OrderedEvent
 from .state_store import SimulatedStateStore
+from .hash_log import HashLog
 from .verdict import ReplayVerdict, VerdictStatus, DivergencePoint
 from ..core.types import JournalEntry
+from ..core.journal import is_msgpack_journal, split_journal
+
+# More than this many gaps puts the system in DEGRADED
+GAP_DEGRADED_THRESHOLD = 5
+
+# Hash log of the replay being verified, set once per worker process
+_worker_hash_log: HashLog = HashLog()
+
+def _init_verify_worker(hash_log: HashLog):
+    global _worker_hash_log
+    _worker_hash_log = hash_log
+
+def _first_mismatch(chunk: List[Tuple[int, str]]) -> Optional[Tuple[int, str, str]]:
+    """First (index, expected, actual) in an index-sorted chunk whose hash differs."""
+    hash_log = _worker_hash_log
+    for index, expected in chunk:
+        actual = hash_log.get(index)
+        if actual is not None and actual != expected:
+            return index, expected, actual
+    return None
 
 class ReplayEngine:
     """
@@ -19,14 +46,18 @@ class ReplayEngine:
     
     Invariant: One event in → one state change out → persist hash → next event.
     """
-    def __init__(self, config: SimulatorConfig):
+    def __init__(self, config: SimulatorConfig, journal: Union[str, os.PathLike, BinaryIO, None] = None):
+        """
+        journal: overrides config.journal_path; may be a binary stream (e.g.
+        io.BytesIO) holding a JSON-lines journal, to replay without disk I/O.
+        """
         self.config = config
         self.rng = DeterministicRNG(config.rng_seed)
         self.state = SimulatedStateStore()
-        self.journal = JournalReader(config.journal_path)
+        self.journal = JournalReader(config.journal_path if journal is None else journal)
         
-        # Hash log: event_index -> state_hash
-        self.hash_log: Dict[int, str] = {}
+        # Hash log: event_index -> state_hash (sized to the journal by run())
+        self.hash_log = HashLog()
         
         # For causal tracking
         self.causal_parent: Optional[int] = None
@@ -34,6 +65,14 @@ class ReplayEngine:
         # Reference hashes for verification (loaded separately)
         self.reference_hashes: Dict[int, str] = {}
 
+        # Event type -> handler; unknown types go to _on_unknown
+        self._dispatch = {
+            "PACKET": self._handle_packet,
+            "STATUS_CHANGE": self._handle_status_change,
+            "GAP": self._handle_gap,
+            "ERROR": self._handle_error,
+        }
+
     def load_reference_hashes(self, reference_path: str):
         """
         Load reference hash log from a previous (live) run.
@@ -48,12 +87,17 @@ class ReplayEngine:
         Execute the replay.
         Returns verdict indicating PASS or FAIL.
         """
-        # Initialize decimal context FIRST
-        init_decimal_context()
-        
-        # Load journal
+        # Decimal context FIRST: a fresh copy of DECIMAL_CONTEXT for the whole
+        # run, so flags never leak between runs and the caller's context is
+        # restored afterwards
+        with localcontext(DECIMAL_CONTEXT):
+            return self._run()
+
+    def _run(self) -> ReplayVerdict:
+        # Load journal (single scan; events are then consumed in order as a stream)
         try:
-            total_events = self.journal.load()
+            events = self.journal.load_streaming()
+            total_events = len(self.journal)
         except Exception as e:
             return ReplayVerdict(
                 status=VerdictStatus.ERROR,
@@ -64,13 +108,25 @@ class ReplayEngine:
                 error_message=f"Journal load failed: {e}"
             )
 
-        processed = 0
-        
+        self.hash_log = HashLog(total_events)
+
+        # Hoisted out of the per-event loop
+        process = self._process_single_event
+        get_hash = self.state.get_state_hash
+        get_digest = self.state.get_state_digest
+        record_hash = self.hash_log.record
+        reference_get = self.reference_hashes.get
+        # Checkpoint hashing only applies when there is nothing to verify against
+        interval = 1 if self.reference_hashes else max(self.config.hash_interval, 1)
+
         # Process events ONE AT A TIME
-        for ordered_event in self.journal:
+        # processed = number of events fully handled before the current one
+        for processed, ordered_event in enumerate(events):
+            index = ordered_event.index
+
             # Step 1: Process the event
             try:
-                self._process_single_event(ordered_event)
+                process(ordered_event)
             except Exception as e:
                 return ReplayVerdict(
                     status=VerdictStatus.ERROR,
@@ -78,71 +134,198 @@ class ReplayEngine:
                     events_total=total_events,
                     config_hash=self.config.config_hash,
                     rng_seed=self.config.rng_seed,
-                    error_message=f"Event {ordered_event.index} failed: {e}"
+                    error_message=f"Event {index} failed: {e}"
                 )
 
-            # Step 2: Compute and store state hash
-            state_hash = self.state.get_state_hash()
-            self.hash_log[ordered_event.index] = state_hash
+            if interval != 1 and processed % interval:
+                self.causal_parent = index
+                continue
+
+            # Step 2: Store state hash
+            record_hash(index, get_digest())
 
             # Step 3: Verify against reference (if available)
-            if ordered_event.index in self.reference_hashes:
-                expected = self.reference_hashes[ordered_event.index]
-                if state_hash != expected:
-                    # DIVERGENCE DETECTED
-                    divergence = DivergencePoint(
-                        event_index=ordered_event.index,
-                        expected_hash=expected,
-                        actual_hash=state_hash,
-                        event_data=ordered_event.event.data,
-                        causal_chain=self._build_causal_chain(ordered_event.index)
-                    )
+            expected = reference_get(index)
+            if expected is not None and get_hash() != expected:
+                # DIVERGENCE DETECTED
+                divergence = DivergencePoint(
+                    event_index=index,
+                    expected_hash=expected,
+                    actual_hash=get_hash(),
+                    event_data=ordered_event.event.data,
+                    causal_chain=self._build_causal_chain(index)
+                )
+                return ReplayVerdict(
+                    status=VerdictStatus.FAIL,
+                    events_processed=processed,
+                    events_total=total_events,
+                    config_hash=self.config.config_hash,
+                    rng_seed=self.config.rng_seed,
+                    divergence=divergence
+                )
+
+            # Update causal parent
+            self.causal_parent = index
+
+        # Checkpoint mode: always record the final state
+        if interval != 1 and total_events and (total_events - 1) % interval:
+            record_hash(index, get_digest())
+
+        # All events processed successfully (the stream was fully consumed)
+        return ReplayVerdict(
+            status=VerdictStatus.PASS,
+            events_processed=total_events,
+            events_total=total_events,
+            config_hash=self.config.config_hash,
+            rng_seed=self.config.rng_seed
+        )
+
+    def run_parallel(self, workers: Optional[int] = None) -> ReplayVerdict:
+        """
+        Replays newline-aligned byte ranges of the journal in worker processes
+        (each from an empty state, one event at a time) and merges the partial
+        states in journal order: position deltas add up, later orders replace
+        earlier ones, gap counts add up, and the last status change that takes
+        effect wins.
+        Only the final state hash is recorded (and checked, if the reference
+        has it); per-event hashes need run(). Falls back to run() for msgpack
+        journals, stream journals and journals not already in replay order.
+        """
+        path = self.journal.journal_path
+        if hasattr(path, "read") or is_msgpack_journal(path):
+            return self.run()
+        workers = workers or os.cpu_count() or 1
+        try:
+            ranges = split_journal(path, workers)
+            if not ranges:
+                return self.run()
+            tasks = [(self.config, path, start, end) for start, end in ranges]
+            with Pool(len(tasks)) as pool:
+                shards = pool.map(_replay_shard, tasks)
+        except Exception as e:
+            return ReplayVerdict(
+                status=VerdictStatus.ERROR,
+                events_processed=0,
+                events_total=0,
+                config_hash=self.config.config_hash,
+                rng_seed=self.config.rng_seed,
+                error_message=f"Journal load failed: {e}"
+            )
+
+        # Shards only combine if the file order is already the replay order
+        prev_key = None
+        for shard in shards:
+            if not shard.in_order or (prev_key is not None and shard.first_key is not None and shard.first_key < prev_key):
+                return self.run()
+            if shard.last_key is not None:
+                prev_key = shard.last_key
+
+        total_events = sum(shard.count for shard in shards)
+        self.hash_log = HashLog(total_events)
+        state = self.state
+        offset = 0
+        with localcontext(DECIMAL_CONTEXT):
+            for shard in shards:
+                for symbol, delta in shard.positions.items():
+                    state.update_position(symbol, delta)
+                for client_order_id, order in shard.orders.items():
+                    state.set_order(client_order_id, order)
+                if shard.gap_count:
+                    state.increment_gap_count(shard.gap_count)
+                # The shard's last gap is the one seen at the new global count
+                set_at, status = shard.status_set or (-1, None)
+                if shard.last_gap > set_at and state.gap_count > GAP_DEGRADED_THRESHOLD:
+                    state.set_system_status("DEGRADED")
+                elif status is not None:
+                    state.set_system_status(status)
+                if shard.count:
+                    state.last_seen_ts = shard.last_ts
+
+                if shard.error is not None:
+                    index = offset + shard.error[0]
                     return ReplayVerdict(
-                        status=VerdictStatus.FAIL,
-                        events_processed=processed,
+                        status=VerdictStatus.ERROR,
+                        events_processed=index,
                         events_total=total_events,
                         config_hash=self.config.config_hash,
                         rng_seed=self.config.rng_seed,
-                        divergence=divergence
+                        error_message=f"Event {index} failed: {shard.error[1]}"
                     )
+                offset += shard.count
 
-            # Update causal parent
-            self.causal_parent = ordered_event.index
-            processed += 1
+        if total_events:
+            last = total_events - 1
+            self.hash_log.record(last, state.get_state_digest())
+            expected = self.reference_hashes.get(last)
+            if expected is not None and state.get_state_hash() != expected:
+                return ReplayVerdict(
+                    status=VerdictStatus.FAIL,
+                    events_processed=last,
+                    events_total=total_events,
+                    config_hash=self.config.config_hash,
+                    rng_seed=self.config.rng_seed,
+                    divergence=DivergencePoint(
+                        event_index=last,
+                        expected_hash=expected,
+                        actual_hash=state.get_state_hash(),
+                        event_data={},
+                        causal_chain=self._build_causal_chain(last)
+                    )
+                )
+            self.causal_parent = last
 
-        # All events processed successfully
         return ReplayVerdict(
             status=VerdictStatus.PASS,
-            events_processed=processed,
+            events_processed=total_events,
             events_total=total_events,
             config_hash=self.config.config_hash,
             rng_seed=self.config.rng_seed
         )
 
+    def verify_hash_log_parallel(self, workers: Optional[int] = None) -> Optional[DivergencePoint]:
+        """
+        Compares the hash log of a finished run() against the reference hashes
+        in worker processes, over contiguous index ranges.
+        For use when run() was executed without reference hashes loaded.
+        Returns the lowest-index divergence, or None if all recorded hashes match.
+        Events are streamed during replay, so event_data is not available here.
+        """
+        workers = workers or os.cpu_count() or 1
+        reference = sorted(self.reference_hashes.items())
+        if not reference:
+            return None
+        chunk_size = -(-len(reference) // (workers * 4))
+        chunks = [reference[i:i + chunk_size] for i in range(0, len(reference), chunk_size)]
+
+        with Pool(workers, initializer=_init_verify_worker, initargs=(self.hash_log,)) as pool:
+            # Results arrive in chunk (= index) order: the first hit is the lowest index
+            for mismatch in pool.imap(_first_mismatch, chunks):
+                if mismatch is not None:
+                    index, expected, actual = mismatch
+                    return DivergencePoint(
+                        event_index=index,
+                        expected_hash=expected,
+                        actual_hash=actual,
+                        event_data={},
+                        causal_chain=self._build_causal_chain(index)
+                    )
+        return None
+
     def _process_single_event(self, ordered_event: OrderedEvent):
         """
         Process exactly ONE event.
         This method MUST be synchronous and deterministic.
         """
         event = ordered_event.event
-        event_type = event.event_type
-        data = event.data
-
-        if event_type == "PACKET":
-            self._handle_packet(data)
-        elif event_type == "STATUS_CHANGE":
-            self._handle_status_change(data)
-        elif event_type == "GAP":
-            self._handle_gap(data)
-        elif event_type == "ERROR":
-            self._handle_error(data)
-        else:
-            # Unknown event type - log but continue
-            pass
+        self._dispatch.get(event.event_type, self._on_unknown)(event.data)
 
         # Update last seen timestamp
         self.state.last_seen_ts = event.timestamp
 
+    def _on_unknown(self, data: Dict[str, Any]):
+        """Unknown event type - no state change, continue."""
+        pass
+
     def _handle_packet(self, data: Dict[str, Any]):
         """
         Handle a market data packet.
@@ -164,14 +347,16 @@ class ReplayEngine:
         status = data.get("status")
         symbol = data.get("symbol", "")
         client_order_id = data.get("client_order_id", "")
-        filled_qty = Decimal(str(data.get("filled_quantity", 0)))
+        qty = data.get("filled_quantity", 0)
+        # Quantities are journaled as strings; numbers still go through str()
+        filled_qty = Decimal(qty) if type(qty) is str else Decimal(str(qty))
         side = data.get("side", "BUY")
 
         # Store order state
         self.state.set_order(client_order_id, data)
 
         # Update position on fills
-        if status in ["PARTIAL_FILL", "FILLED"]:
+        if status in ("PARTIAL_FILL", "FILLED"):
             delta = filled_qty if side == "BUY" else -filled_qty
             self.state.update_position(symbol, delta)
 
@@ -184,7 +369,7 @@ class ReplayEngine:
         """Handle gap detection event."""
         self.state.increment_gap_count()
         # Gap may trigger DEGRADED status
-        if self.state.gap_count > 5:
+        if self.state.gap_count > GAP_DEGRADED_THRESHOLD:
             self.state.set_system_status("DEGRADED")
 
     def _handle_error(self, data: Dict[str, Any]):
@@ -209,4 +394,83 @@ class ReplayEngine:
         """Save the hash log for future reference comparison."""
         import json
         with open(output_path, 'w') as f:
-            json.dump(self.hash_log, f, indent=2)
+            json.dump(dict(self.hash_log.items()), f, indent=2)
+
+class _ShardReplay(ReplayEngine):
+    """
+    Replays one byte range of the journal from an empty state (run_parallel).
+    Positions, orders and the gap count go to self.state as usual; status
+    changes depend on the global gap count, so they are recorded instead.
+    """
+    def __init__(self, config: SimulatorConfig, journal: str):
+        super().__init__(config, journal)
+        self.position = 0 # local index of the event being processed
+        self.status_set: Optional[Tuple[int, str]] = None # last explicit status change
+        self.last_gap = -1 # local index of the last gap
+
+    def _handle_status_change(self, data: Dict[str, Any]):
+        self.status_set = (self.position, data.get("status", "CONNECTED"))
+
+    def _handle_gap(self, data: Dict[str, Any]):
+        self.state.increment_gap_count()
+        self.last_gap = self.position
+
+    def _handle_error(self, data: Dict[str, Any]):
+        if data.get("error_type", "") == "CRITICAL":
+            self.status_set = (self.position, "HALT")
+
+@dataclass
+class _ShardResult:
+    """Partial state of one replayed shard; indices are local to the shard."""
+    count: int
+    first_key: Optional[tuple]
+    last_key: Optional[tuple]
+    in_order: bool
+    positions: Dict[str, Decimal]
+    orders: Dict[str, Dict[str, Any]]
+    gap_count: int
+    status_set: Optional[Tuple[int, str]]
+    last_gap: int
+    last_ts: int
+    error: Optional[Tuple[int, str]]
+
+def _replay_shard(task: Tuple[SimulatorConfig, str, int, int]) -> _ShardResult:
+    config, path, start, end = task
+    shard = _ShardReplay(config, path)
+    process = shard._process_single_event
+    count = 0
+    first_key = last_key = None
+    in_order = True
+    error = None
+    with localcontext(DECIMAL_CONTEXT):
+        for ordered_event in shard.journal.iter_range(start, end):
+            # Ordering key without the journal index (which only breaks ties)
+            key = ordered_event._key[:3]
+            if last_key is None:
+                first_key = key
+            elif key < last_key:
+                in_order = False
+                break
+            last_key = key
+            if error is None:
+                shard.position = ordered_event.index
+                try:
+                    process(ordered_event)
+                except Exception as e:
+                    error = (ordered_event.index, str(e))
+            count += 1
+
+    state = shard.state
+    return _ShardResult(
+        count=count,
+        first_key=first_key,
+        last_key=last_key,
+        in_order=in_order,
+        positions=state.positions,
+        orders=state.orders,
+        gap_count=state.gap_count,
+        status_set=shard.status_set,
+        last_gap=shard.last_gap,
+        last_ts=state.last_seen_ts,
+        error=error,
+    )
@@ -4,42 +4,103 @@ OmniTrade Simulator: State Hasher
 Computes deterministic hashes of system state at event boundaries.
 Used to detect replay divergence.
 """
-import hashlib
-import json
+from hashlib import sha256 as _sha256
 from decimal import Decimal
 from typing import Dict, Any
+import orjson
+import xxhash
+from blake3 import blake3
 
-class DecimalEncoder(json.JSONEncoder):
-    """JSON encoder that handles Decimal types."""
-    def default(self, obj):
-        if isinstance(obj, Decimal):
-            return str(obj)
-        return super().default(obj)
+_CANONICAL_OPTS = orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+# Snapshots at least this large are hashed with BLAKE3's multithreaded mode
+_BLAKE3_PARALLEL_MIN_BYTES = 1 << 20
+
+def _orjson_default(obj):
+    if isinstance(obj, Decimal):
+        return str(obj)
+    raise TypeError
 
 class StateHasher:
     """
-    Computes deterministic SHA-256 hashes of system state.
+    Computes deterministic hashes of system state.
+    Divergence detection only needs change detection, so hash_state defaults
+    to xxh3-128; SHA-256 and BLAKE3 are available for audit use.
     """
     
     @staticmethod
-    def hash_state(state: Dict[str, Any]) -> str:
+    def hash_state(state: Dict[str, Any], cryptographic: bool = False) -> str:
         """
         Computes a deterministic hash of the given state dictionary.
         Keys are sorted for determinism.
+        xxh3-128 (32 hex chars) by default; SHA-256 (64 hex chars) if cryptographic.
+        """
+        buf = StateHasher.canonical_bytes(state)
+        if cryptographic:
+            return _sha256(buf).hexdigest()
+        return xxhash.xxh3_128_hexdigest(buf)
+
+    @staticmethod
+    def hash_state_cryptographic(state: Dict[str, Any]) -> str:
+        """
+        Audit-grade BLAKE3 hash (64 hex chars) of the canonical state.
+        Large snapshots are hashed on multiple threads; the digest is the same.
         """
-        # Serialize with sorted keys for determinism
-        serialized = json.dumps(state, sort_keys=True, cls=DecimalEncoder)
-        return hashlib.sha256(serialized.encode('utf-8')).hexdigest()
+        buf = StateHasher.canonical_bytes(state)
+        if len(buf) >= _BLAKE3_PARALLEL_MIN_BYTES:
+            return blake3(buf, max_threads=blake3.AUTO).hexdigest()
+        return blake3(buf).hexdigest()
+
+    @staticmethod
+    def canonical_bytes(value: Any) -> bytes:
+        """
+        Canonical JSON encoding of a state value (sorted keys, Decimal as str,
+        non-string keys stringified), as bytes ready for hashing.
+        """
+        return orjson.dumps(value, default=_orjson_default, option=_CANONICAL_OPTS)
+
+    @staticmethod
+    def hash_entry(key: str, value: Any) -> int:
+        """
+        xxh3-128 digest (as an int) of one keyed state entry.
+        Entry digests are XOR-combined into an incremental state hash, so a
+        mutation only rehashes the entry it touches.
+        """
+        return xxhash.xxh3_128_intdigest(key.encode('utf-8') + b"\x00" + StateHasher.canonical_bytes(value))
+
+    @staticmethod
+    def hash_int_entry(key: str, value: int) -> int:
+        """
+        hash_entry for an int value of any size. Same digest as hash_entry
+        wherever orjson can encode the int (64-bit range); beyond that orjson
+        raises, so the decimal digits are written directly.
+        """
+        return xxhash.xxh3_128_intdigest(b"%s\x00%d" % (key.encode('utf-8'), value))
+
+    @staticmethod
+    def _positions_digest(positions: Dict[str, Decimal]) -> int:
+        # Deferred: state_store imports this module
+        from .state_store import _to_fixed
+        digest = 0
+        for symbol, qty in positions.items():
+            digest ^= StateHasher.hash_int_entry("positions:" + symbol, _to_fixed(qty))
+        return digest
+
+    @staticmethod
+    def _orders_digest(orders: Dict[str, Any]) -> int:
+        digest = 0
+        for client_order_id, order in orders.items():
+            digest ^= StateHasher.hash_entry("orders:" + client_order_id, order)
+        return digest
 
     @staticmethod
     def hash_positions(positions: Dict[str, Decimal]) -> str:
-        """Hash position state."""
-        return StateHasher.hash_state({"positions": positions})
+        """Hash position state (XOR of the position entry digests)."""
+        return f"{StateHasher._positions_digest(positions):032x}"
 
     @staticmethod
     def hash_orders(orders: Dict[str, Any]) -> str:
-        """Hash order state."""
-        return StateHasher.hash_state({"orders": orders})
+        """Hash order state (XOR of the order entry digests)."""
+        return f"{StateHasher._orders_digest(orders):032x}"
 
     @staticmethod
     def hash_full_state(
@@ -50,11 +111,14 @@ class StateHasher:
     ) -> str:
         """
         Hash the complete system state.
+        Built from the same per-entry digests as
+        SimulatedStateStore.get_state_hash(), so hashing a snapshot gives the
+        same value as the store it was taken from.
         """
-        state = {
-            "positions": positions,
-            "orders": orders,
-            "system_status": system_status,
-            "gap_count": gap_count
-        }
-        return StateHasher.hash_state(state)
+        digest = (
+            StateHasher._positions_digest(positions)
+            ^ StateHasher._orders_digest(orders)
+            ^ StateHasher.hash_entry("system_status", system_status)
+            ^ StateHasher.hash_entry("gap_count", gap_count)
+        )
+        return f"{digest:032x}"
@@ -5,59 +5,142 @@ In-memory state store for simulation (no Redis dependency).
 Mimics the StateController interface for code path parity.
 """
 from decimal import Decimal
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 from .state_hasher import StateHasher
 
+# Positions are fixed-point integers in units of 10**-POSITION_SCALE_DIGITS
+POSITION_SCALE_DIGITS = 9
+
+def _to_fixed(qty: Decimal) -> int:
+    """Exact Decimal -> scaled int; quantities finer than the scale are rejected."""
+    scaled = qty.scaleb(POSITION_SCALE_DIGITS)
+    fixed = int(scaled)
+    if fixed != scaled:
+        raise ValueError(f"Quantity {qty} has more than {POSITION_SCALE_DIGITS} decimal places")
+    return fixed
+
+def _from_fixed(fixed: int) -> Decimal:
+    return Decimal(fixed).scaleb(-POSITION_SCALE_DIGITS)
+
 class SimulatedStateStore:
     """
     In-memory state store for deterministic replay.
     Mirrors StateController but without Redis.
+
+    The state hash is maintained incrementally: every hashed entry (one per
+    position, one per order, plus status and gap count) has its own xxh3-128 digest,
+    and the state hash is the XOR of all entry digests. A mutation rehashes
+    only the entry it touches, so get_state_hash() is O(1) instead of
+    re-serializing the whole state. All mutations MUST go through the methods
+    below; orders must not be modified in place.
     """
     def __init__(self):
-        self.positions: Dict[str, Decimal] = {}
+        # Positions as parallel arrays (symbol, fixed-point quantity, hash-entry
+        # key), indexed by symbol in insertion order. Fills are integer adds;
+        # Decimal only at the API boundary.
+        self._symbols: List[str] = []
+        self._positions: List[int] = []
+        self._position_keys: List[str] = []
+        self._sym_idx: Dict[str, int] = {}
         self.orders: Dict[str, Dict[str, Any]] = {}
-        self.system_status: str = "CONNECTED"
-        self.gap_count: int = 0
         self.last_seen_ts: int = 0
+        # Per-entry digests and their XOR
+        self._entry_hashes: Dict[str, int] = {}
+        self._root_hash = 0
+        # Hex form of _root_hash; None when stale (any entry changed since)
+        self._cached_hash: Optional[str] = None
+        self._set_entry("system_status", "CONNECTED")
+        self._set_entry("gap_count", 0)
+        self._system_status = "CONNECTED"
+        self._gap_count = 0
+
+    def _set_entry(self, key: str, value: Any):
+        """Replace one entry's digest in the running state hash."""
+        self._replace_digest(key, StateHasher.hash_entry(key, value))
+
+    def _replace_digest(self, key: str, new: int):
+        self._root_hash ^= self._entry_hashes.get(key, 0) ^ new
+        self._entry_hashes[key] = new
+        self._cached_hash = None
+
+    def _store_position(self, idx: int, fixed: int):
+        """Set one fixed-point position; hashed before anything is mutated."""
+        key = self._position_keys[idx]
+        new = StateHasher.hash_int_entry(key, fixed)
+        self._positions[idx] = fixed
+        self._replace_digest(key, new)
+
+    @property
+    def system_status(self) -> str:
+        return self._system_status
+
+    @property
+    def gap_count(self) -> int:
+        return self._gap_count
+
+    @property
+    def positions(self) -> Dict[str, Decimal]:
+        """Positions by symbol (a new dict; mutate through the methods below)."""
+        return {symbol: _from_fixed(qty) for symbol, qty in zip(self._symbols, self._positions)}
+
+    def _position_index(self, symbol: str) -> int:
+        idx = self._sym_idx.get(symbol)
+        if idx is None:
+            idx = self._sym_idx[symbol] = len(self._symbols)
+            self._symbols.append(symbol)
+            self._positions.append(0)
+            self._position_keys.append("positions:" + symbol)
+        return idx
 
     def update_position(self, symbol: str, delta: Decimal):
         """Update position by delta amount."""
-        current = self.positions.get(symbol, Decimal("0"))
-        self.positions[symbol] = current + delta
+        fixed_delta = _to_fixed(delta)
+        idx = self._position_index(symbol)
+        self._store_position(idx, self._positions[idx] + fixed_delta)
 
     def set_position(self, symbol: str, qty: Decimal):
         """Set absolute position."""
-        self.positions[symbol] = qty
+        fixed = _to_fixed(qty)
+        self._store_position(self._position_index(symbol), fixed)
 
     def get_position(self, symbol: str) -> Decimal:
-        return self.positions.get(symbol, Decimal("0"))
+        idx = self._sym_idx.get(symbol)
+        return Decimal("0") if idx is None else _from_fixed(self._positions[idx])
 
     def set_order(self, client_order_id: str, order_data: Dict[str, Any]):
         """Store order state."""
         self.orders[client_order_id] = order_data
+        self._set_entry("orders:" + client_order_id, order_data)
 
     def get_order(self, client_order_id: str) -> Optional[Dict[str, Any]]:
         return self.orders.get(client_order_id)
 
     def set_system_status(self, status: str):
-        self.system_status = status
+        self._system_status = status
+        self._set_entry("system_status", status)
+
+    def increment_gap_count(self, n: int = 1):
+        self._gap_count += n
+        self._set_entry("gap_count", self._gap_count)
 
-    def increment_gap_count(self):
-        self.gap_count += 1
+    def get_state_digest(self) -> int:
+        """The current state hash as a 128-bit int (no formatting)."""
+        return self._root_hash
 
     def get_state_hash(self) -> str:
-        """Compute hash of current full state."""
-        return StateHasher.hash_full_state(
-            positions=self.positions,
-            orders=self.orders,
-            system_status=self.system_status,
-            gap_count=self.gap_count
-        )
+        """
+        Hash of current full state (incrementally maintained).
+        Formatted once per change; repeated reads return the cached string.
+        """
+        cached = self._cached_hash
+        if cached is None:
+            cached = self._cached_hash = f"{self._root_hash:032x}"
+        return cached
 
     def snapshot(self) -> Dict[str, Any]:
         """Return a copy of current state."""
         return {
-            "positions": dict(self.positions),
+            "positions": self.positions,
             "orders": dict(self.orders),
             "system_status": self.system_status,
             "gap_count": self.gap_count,
@@ -1,7 +1,61 @@
+import inspect
 from abc import ABC, abstractmethod
-import datetime
+from functools import lru_cache
+import numpy as np
+from ..core.logger import get_logger
+from ..core.types import Signal
+from ..utils._njit import HAS_NUMBA
+
+logger = get_logger("BaseStrategy")
+
+@lru_cache(maxsize=4096)
+def _cached_validate(risk_manager, symbol, signal, key):
+    """
+    validate_trade result for one (risk manager, symbol, signal, stateless key).
+    key is whatever the manager's stateless_key() returned (e.g. an exposure
+    bucket); it is part of the cache key only.
+    """
+    return risk_manager.validate_trade(symbol, signal)
+
+def invalidate_risk_cache():
+    """
+    Drops all cached validate_trade results.
+    Risk managers call this when their configuration changes.
+    """
+    _cached_validate.cache_clear()
 
 class BaseStrategy(ABC):
+    """
+    Slotted: instances have no __dict__, so attributes cannot be added
+    dynamically. Subclasses should declare their own __slots__ (at least
+    `__slots__ = ()`), otherwise they get a __dict__ back.
+
+    Signal logic lives in _signal_kernel: a free function over NumPy arrays,
+    ideally decorated with utils._njit.njit(cache=True), assigned as a
+    staticmethod. Subclasses set SIGNAL_PARAMS for the kernel's parameters
+    (any sequence of numbers; stored as a float64 array). A subclass must
+    override _signal_kernel or generate_signal, checked at class creation
+    (abstract subclasses are exempt, and are not JIT-warmed).
+    """
+    __slots__ = ("name", "symbol", "timeframe", "is_active", "current_position")
+
+    # float64 parameters passed to _signal_kernel
+    SIGNAL_PARAMS = np.empty(0)
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Intermediate abstract bases may leave the signal logic to their subclasses
+        if inspect.isabstract(cls):
+            return
+        if cls._signal_kernel is BaseStrategy._signal_kernel and cls.generate_signal is BaseStrategy.generate_signal:
+            raise TypeError(f"{cls.__name__} must override _signal_kernel or generate_signal")
+        # One contiguous float64 array, so the kernel is compiled for a single
+        # signature (and never sees a reflected list)
+        cls.SIGNAL_PARAMS = np.ascontiguousarray(cls.SIGNAL_PARAMS, dtype=np.float64)
+        # Compile (or load from cache) the JIT kernel at import, not on the first tick
+        if HAS_NUMBA and "_signal_kernel" in cls.__dict__:
+            cls._signal_kernel(np.zeros(16), cls.SIGNAL_PARAMS)
+
     def __init__(self, name, symbol, timeframe):
         self.name = name
         self.symbol = symbol
@@ -9,13 +63,22 @@ class BaseStrategy(ABC):
         self.is_active = False
         self.current_position = 0 # 0: Flat, 1: Long, -1: Short
 
-    @abstractmethod
-    def generate_signal(self, data):
+    @staticmethod
+    def _signal_kernel(prices: np.ndarray, params: np.ndarray) -> np.ndarray:
+        """
+        Per-price signals (Signal values as numbers) for a window of prices.
+        """
+        raise NotImplementedError
+
+    def generate_signal(self, data) -> Signal:
         """
         Logic to decide if we should buy or sell. 
-        Must return: 'BUY', 'SELL', or 'HOLD'
+        Must return a Signal: Signal.BUY, Signal.SELL or Signal.HOLD
+        Runs _signal_kernel on the price window and returns its last signal.
         """
-        pass
+        prices = np.ascontiguousarray(data, dtype=np.float64)
+        signals = self._signal_kernel(prices, self.SIGNAL_PARAMS)
+        return Signal(int(signals[-1]))
 
     @abstractmethod
     def calculate_position_size(self, account_balance):
@@ -25,17 +88,26 @@ class BaseStrategy(ABC):
         """
         pass
 
-    def check_risk(self, signal, risk_manager):
+    def check_risk(self, signal: Signal, risk_manager):
         """
         The Filter: Checks with the Risk Manager before sending the order.
+        If the manager provides stateless_key(symbol, signal) and it returns a
+        hashable key (not None), the result is memoized per key until
+        invalidate_risk_cache() is called.
         """
-        print(f"[{datetime.datetime.now()}] {self.name}: Validating {signal} via Risk Manager...")
+        logger.info("risk_check", strategy=self.name, signal=signal)
+        stateless_key = getattr(risk_manager, "stateless_key", None)
+        if stateless_key is not None:
+            key = stateless_key(self.symbol, signal)
+            if key is not None:
+                return _cached_validate(risk_manager, self.symbol, signal, key)
         return risk_manager.validate_trade(self.symbol, signal)
 
-    def execute_trade(self, signal, execution_engine):
+    def execute_trade(self, signal: Signal, execution_engine):
         """
         The Hand: Sends the validated signal to the actual broker adapter.
+        Signal.HOLD (0) is falsy and sends nothing.
         """
-        if signal != 'HOLD':
-            print(f"[{datetime.datetime.now()}] {self.name}: Executing {signal} for {self.symbol}")
+        if signal:
+            logger.info("trade_execute", strategy=self.name, signal=signal, symbol=self.symbol)
             execution_engine.place_order(self.symbol, signal)
\ No newline at end of file
@@ -0,0 +1,25 @@
+"""
+Optional Numba JIT.
+
+njit is numba.njit when numba is installed; otherwise it is a no-op
+decorator, so kernels written for Numba still run (as plain Python/NumPy).
+Supports both @njit and @njit(cache=True, ...).
+
+cache=True kernels are cached in NUMBA_CACHE_DIR when it is set (the test
+suite points it at <repo>/numba_cache; deployments set it in their own
+environment), otherwise in per-module __pycache__ directories.
+Set NUMBA_DISABLE_JIT=1 to run kernels uncompiled (e.g. in CI).
+"""
+try:
+    from numba import njit as _numba_njit
+except ImportError:
+    _numba_njit = None
+
+HAS_NUMBA = _numba_njit is not None
+
+def njit(*args, **kwargs):
+    if _numba_njit is not None:
+        return _numba_njit(*args, **kwargs)
+    if len(args) == 1 and callable(args[0]) and not kwargs:
+        return args[0]
+    return lambda fn: fn
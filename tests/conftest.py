@@ -0,0 +1,8 @@
+import os
+
+# Persist cache=True Numba kernels across test runs (see src/utils/_njit.py).
+# Set before any test module imports numba.
+os.environ.setdefault(
+    "NUMBA_CACHE_DIR",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "numba_cache"),
+)
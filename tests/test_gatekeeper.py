@@ -1,7 +1,8 @@
 import unittest
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 from src.gatekeeper.command_registry import CommandRegistry
 from src.gatekeeper.rate_limiter import TokenBucket
+from src.gatekeeper.guard import ExecutionGuard
 from src.core.types import OrderIntent, OrderSide, OrderType
 
 class TestGatekeeper(unittest.TestCase):
@@ -19,6 +20,28 @@ class TestGatekeeper(unittest.TestCase):
         self.assertTrue(registry.register(intent))
         self.assertFalse(registry.register(intent)) # Duplicate
 
+    def test_malformed_intent_rejected(self):
+        with self.assertRaises(ValueError):
+            OrderIntent(
+                client_order_id=123,
+                symbol=None,
+                side="buy",
+                order_type="bogus",
+                quantity="lots",
+                timestamp="x"
+            )
+        # Enum values are coerced, as with the pydantic model
+        intent = OrderIntent(
+            client_order_id="124",
+            symbol="BTCUSDT",
+            side="SELL",
+            order_type="MARKET",
+            quantity=2,
+            timestamp=1000
+        )
+        self.assertIs(intent.side, OrderSide.SELL)
+        self.assertIs(intent.order_type, OrderType.MARKET)
+
     def test_rate_limiter(self):
         # 10 tokens, 10/sec
         bucket = TokenBucket(rate=10, capacity=10)
@@ -28,5 +51,49 @@ class TestGatekeeper(unittest.TestCase):
         # Next should fail immediately
         self.assertFalse(bucket.consume(1.0))
 
+class TestExecutionGuardStatusCache(unittest.TestCase):
+    NOW = 10_000_000
+
+    def _guard(self, status, last_update):
+        guard = ExecutionGuard("redis://localhost:6379/0") # connects lazily
+        guard.redis = MagicMock()
+        guard.redis.mget.return_value = (status, str(last_update))
+        return guard
+
+    def test_single_mget_within_ttl_then_refresh(self):
+        guard = self._guard("CONNECTED", self.NOW)
+        ttl = guard.status_cache_ttl_us
+        with patch("src.gatekeeper.guard.Clock.now_us") as now_us:
+            for offset in range(0, ttl, ttl // 5):
+                now_us.return_value = self.NOW + offset
+                self.assertTrue(guard.validate_intent())
+            guard.redis.mget.assert_called_once_with("observer:status", "observer:last_update")
+
+            # After the TTL the status is re-read (and the new value is used)
+            guard.redis.mget.return_value = ("HALT", str(self.NOW))
+            now_us.return_value = self.NOW + ttl
+            with self.assertRaisesRegex(RuntimeError, "status is HALT"):
+                guard.validate_intent()
+            self.assertEqual(guard.redis.mget.call_count, 2)
+
+    def test_cached_halt_still_blocks(self):
+        guard = self._guard("HALT", self.NOW)
+        with patch("src.gatekeeper.guard.Clock.now_us", return_value=self.NOW):
+            for _ in range(3):
+                with self.assertRaisesRegex(RuntimeError, "status is HALT"):
+                    guard.validate_intent()
+        guard.redis.mget.assert_called_once()
+
+    def test_cached_stale_heartbeat_still_blocks(self):
+        guard = self._guard("CONNECTED", self.NOW - 1_990_000)
+        with patch("src.gatekeeper.guard.Clock.now_us") as now_us:
+            now_us.return_value = self.NOW
+            self.assertTrue(guard.validate_intent())
+            # Same cached heartbeat, but the clock has moved past the 2s tolerance
+            now_us.return_value = self.NOW + 20_000
+            with self.assertRaisesRegex(RuntimeError, "heartbeat stale"):
+                guard.validate_intent()
+        guard.redis.mget.assert_called_once()
+
 if __name__ == '__main__':
     unittest.main()
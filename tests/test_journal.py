@@ -0,0 +1,109 @@
+import unittest
+import asyncio
+import os
+import tempfile
+import threading
+from unittest import mock
+from src.core.journal import RawJournal
+from src.core.types import JournalEntry
+
+def _entry(ts):
+    return JournalEntry(event_type="GAP", timestamp=ts, data={"n": ts})
+
+class TestRawJournal(unittest.TestCase):
+    def setUp(self):
+        self._dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self._dir.name, "journal.jsonl")
+
+    def tearDown(self):
+        self._dir.cleanup()
+
+    def _timestamps(self):
+        return [e.timestamp for e in RawJournal.replay(self.path)]
+
+    def test_buffered_until_batch_threshold(self):
+        journal = RawJournal(self.path, max_batch=4, fsync=False)
+        for ts in range(3):
+            journal.append(_entry(ts))
+        self.assertEqual(os.path.getsize(self.path), 0)
+
+        journal.append(_entry(3)) # 4th entry reaches max_batch
+        self.assertEqual(self._timestamps(), [0, 1, 2, 3])
+        journal.close()
+
+    def test_buffered_until_byte_threshold(self):
+        journal = RawJournal(self.path, max_buffer_bytes=200, fsync=False)
+        journal.append_packet(1, {"payload": "x" * 50})
+        self.assertEqual(os.path.getsize(self.path), 0)
+
+        journal.append_packet(2, {"payload": "x" * 200})
+        self.assertEqual(self._timestamps(), [1, 2])
+        journal.close()
+
+    def test_close_flushes_and_fsyncs(self):
+        journal = RawJournal(self.path)
+        journal.append(_entry(1))
+        journal.append_packet(2, {"drift_us": 5})
+        self.assertEqual(os.path.getsize(self.path), 0)
+
+        with mock.patch("src.core.journal.os.fsync", wraps=os.fsync) as fsync:
+            journal.close()
+        self.assertEqual(fsync.call_count, 1)
+        self.assertEqual(self._timestamps(), [1, 2])
+        journal.close() # idempotent
+
+    def test_flusher_tick_writes_and_group_fsyncs(self):
+        async def run():
+            journal = RawJournal(self.path, flush_interval_s=0.01)
+            with mock.patch("src.core.journal.os.fsync", wraps=os.fsync) as fsync:
+                flusher = asyncio.create_task(journal.run_flusher())
+                for ts in range(10):
+                    journal.append(_entry(ts))
+                self.assertEqual(os.path.getsize(self.path), 0)
+
+                await asyncio.sleep(0.05)
+                self.assertEqual(self._timestamps(), list(range(10)))
+                # One fsync for the whole batch, none on idle ticks
+                self.assertEqual(fsync.call_count, 1)
+
+                flusher.cancel()
+                with self.assertRaises(asyncio.CancelledError):
+                    await flusher
+            journal.close()
+
+        asyncio.run(run())
+
+    def test_close_during_inflight_fsync(self):
+        started = threading.Event()
+        release = threading.Event()
+        real_fsync = os.fsync
+
+        def slow_fsync(fd):
+            # Only the flusher's fsync (off the event loop thread) is slowed
+            if threading.current_thread() is not threading.main_thread():
+                started.set()
+                release.wait(5)
+            real_fsync(fd)
+
+        async def run():
+            journal = RawJournal(self.path, flush_interval_s=0.01)
+            with mock.patch("src.core.journal.os.fsync", side_effect=slow_fsync):
+                flusher = asyncio.create_task(journal.run_flusher())
+                journal.append(_entry(1))
+                self.assertTrue(await asyncio.to_thread(started.wait, 5))
+
+                journal.close() # closes the fd under the in-flight fsync
+                release.set()
+                await asyncio.sleep(0.05)
+
+                # The EBADF from the in-flight fsync was absorbed
+                self.assertFalse(flusher.done())
+                flusher.cancel()
+                with self.assertRaises(asyncio.CancelledError):
+                    await flusher
+            self.assertEqual(self._timestamps(), [1])
+
+        asyncio.run(run())
+
+if __name__ == '__main__':
+    unittest.main()
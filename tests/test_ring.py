@@ -0,0 +1,42 @@
+import unittest
+import asyncio
+from src.core.ring import PacketRing
+
+class TestPacketRing(unittest.TestCase):
+    def test_fifo_with_backpressure(self):
+        async def run():
+            ring = PacketRing(4)
+            received = []
+
+            async def produce(tag):
+                for i in range(50):
+                    await ring.put((tag, i))
+
+            async def consume():
+                while len(received) < 100:
+                    batch = await ring.get_batch(3)
+                    self.assertLessEqual(len(batch), 3)
+                    received.extend(batch)
+
+            await asyncio.gather(produce("a"), produce("b"), consume())
+            return ring, received
+
+        ring, received = asyncio.run(run())
+        self.assertTrue(ring.empty())
+        for tag in ("a", "b"):
+            self.assertEqual([i for t, i in received if t == tag], list(range(50)))
+
+    def test_nowait_bounds(self):
+        ring = PacketRing(2)
+        ring.put_nowait(1)
+        ring.put_nowait(2)
+        self.assertTrue(ring.full())
+        with self.assertRaises(asyncio.QueueFull):
+            ring.put_nowait(3)
+        self.assertEqual(ring.get_nowait(), 1)
+        self.assertEqual(ring.get_nowait(), 2)
+        with self.assertRaises(asyncio.QueueEmpty):
+            ring.get_nowait()
+
+if __name__ == '__main__':
+    unittest.main()
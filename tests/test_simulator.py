@@ -3,9 +3,11 @@ Unit tests for the Deterministic Simulator.
 Tests: Decimal context, state hashing, replay determinism.
 """
 import unittest
+import io
 import tempfile
 import json
 import os
+import numpy as np
 from decimal import Decimal
 from src.simulator.context import (
     init_decimal_context, 
@@ -16,7 +18,11 @@ from src.simulator.context import (
 from src.simulator.state_hasher import StateHasher
 from src.simulator.state_store import SimulatedStateStore
 from src.simulator.replay_engine import ReplayEngine
+from src.simulator.journal_reader import JournalReader
+from src.simulator.hash_log import HashLog
 from src.simulator.verdict import VerdictStatus
+from src.core.journal import RawJournal
+from src.core.types import JournalEntry
 
 class TestDecimalContext(unittest.TestCase):
     def test_context_initialization(self):
@@ -37,19 +43,18 @@ class TestDeterministicRNG(unittest.TestCase):
         rng1 = DeterministicRNG(seed=12345)
         rng2 = DeterministicRNG(seed=12345)
         
-        for _ in range(100):
-            self.assertEqual(rng1.randint(0, 1000), rng2.randint(0, 1000))
+        a = rng1.randint_batch(0, 1000, 100)
+        b = rng2.randint_batch(0, 1000, 100)
+        np.testing.assert_array_equal(a, b)
+        self.assertTrue(((a >= 0) & (a <= 1000)).all())
 
     def test_different_seeds(self):
         rng1 = DeterministicRNG(seed=1)
         rng2 = DeterministicRNG(seed=2)
-        # Very unlikely to be equal across 10 iterations
-        different = False
-        for _ in range(10):
-            if rng1.randint(0, 1000000) != rng2.randint(0, 1000000):
-                different = True
-                break
-        self.assertTrue(different)
+        # Very unlikely to be equal across 10 draws
+        a = rng1.randint_batch(0, 10**6, 10)
+        b = rng2.randint_batch(0, 10**6, 10)
+        self.assertTrue(bool((a != b).any()))
 
 class TestStateHasher(unittest.TestCase):
     def test_hash_determinism(self):
@@ -76,47 +81,236 @@ class TestSimulatedStateStore(unittest.TestCase):
         hash2 = store.get_state_hash()
         self.assertNotEqual(hash1, hash2)
 
-class TestReplayEngine(unittest.TestCase):
-    def test_empty_journal(self):
-        # Create empty journal
+    def test_state_hash_depends_only_on_state(self):
+        # Same final state via different mutation paths -> same hash
+        store1 = SimulatedStateStore()
+        store1.update_position("BTCUSDT", Decimal("2.0"))
+        store1.update_position("ETHUSDT", Decimal("1.0"))
+        store1.set_order("a", {"status": "FILLED"})
+
+        store2 = SimulatedStateStore()
+        store2.set_order("a", {"status": "NEW"})
+        store2.update_position("ETHUSDT", Decimal("1.0"))
+        store2.update_position("BTCUSDT", Decimal("3.0"))
+        store2.update_position("BTCUSDT", Decimal("-1.0"))
+        store2.set_order("a", {"status": "FILLED"})
+
+        self.assertEqual(store1.get_state_hash(), store2.get_state_hash())
+
+    def test_full_state_hash_matches_store(self):
+        store = SimulatedStateStore()
+        store.update_position("BTCUSDT", Decimal("1.5"))
+        store.update_position("ETHUSDT", Decimal("-20000000000"))
+        store.set_order("a", {"status": "FILLED", "qty": "1.5"})
+        store.increment_gap_count()
+        store.set_system_status("DEGRADED")
+
+        snap = store.snapshot()
+        self.assertEqual(
+            StateHasher.hash_full_state(snap["positions"], snap["orders"], snap["system_status"], snap["gap_count"]),
+            store.get_state_hash()
+        )
+
+    def test_large_positions(self):
+        # Fixed-point values beyond the 64-bit range (e.g. billions of meme tokens)
+        store = SimulatedStateStore()
+        store.update_position("PEPEUSDT", Decimal("15000000000"))
+        store.update_position("PEPEUSDT", Decimal("5000000000"))
+        store.update_position("SHIBUSDT", Decimal("-10000000000"))
+        self.assertEqual(store.get_position("PEPEUSDT"), Decimal("20000000000"))
+        self.assertEqual(store.get_position("SHIBUSDT"), Decimal("-10000000000"))
+
+        store2 = SimulatedStateStore()
+        store2.set_position("SHIBUSDT", Decimal("-10000000000"))
+        store2.set_position("PEPEUSDT", Decimal("20000000000"))
+        self.assertEqual(store.get_state_hash(), store2.get_state_hash())
+
+class TestHashLog(unittest.TestCase):
+    def test_sparse_record_and_lookup(self):
+        log = HashLog(5)
+        digest = (1 << 127) | 0xABC
+        log.record(3, digest)
+        log.record(0, 7)
+        log.record(3, digest)
+
+        self.assertEqual(len(log), 2)
+        self.assertEqual(list(log), [0, 3])
+        self.assertEqual(log[3], f"{digest:032x}")
+        self.assertNotIn(1, log)
+        self.assertIsNone(log.get(4))
+        self.assertIsNone(log.get(99))
+
+class TestJournalReader(unittest.TestCase):
+    def test_out_of_order_journal_is_sorted(self):
+        # Two sources interleaved out of arrival order, plus a timestamp tie
+        events = [
+            {"event_type": "PACKET", "timestamp": 300, "data": {"source": "binance_ws", "sequence_id": 3}},
+            {"event_type": "PACKET", "timestamp": 100, "data": {"source": "kite_rest"}},
+            {"event_type": "PACKET", "timestamp": 200, "data": {"source": "binance_ws", "sequence_id": 2}},
+            {"event_type": "STATUS_CHANGE", "timestamp": 100, "data": {"status": "CONNECTED"}},
+        ]
         with tempfile.NamedTemporaryFile(mode='w', suffix='.jsonl', delete=False) as f:
-            f.write("")
+            f.write("".join(json.dumps(e) + "\n" for e in events))
             journal_path = f.name
-        
+
         try:
-            config = SimulatorConfig(
-                config_hash="test",
-                rng_seed=42,
-                journal_path=journal_path
-            )
-            engine = ReplayEngine(config)
-            verdict = engine.run()
-            self.assertEqual(verdict.status, VerdictStatus.PASS)
-            self.assertEqual(verdict.events_processed, 0)
+            reader = JournalReader(journal_path)
+            self.assertEqual(reader.load(), 4)
+            # ts 100: kite_rest (priority 2) before unknown source (priority 3)
+            self.assertEqual([e.index for e in reader], [1, 3, 2, 0])
+        finally:
+            os.unlink(journal_path)
+
+    def test_msgpack_journal_round_trip(self):
+        with tempfile.NamedTemporaryFile(suffix='.mpk', delete=False) as f:
+            journal_path = f.name
+
+        try:
+            journal = RawJournal(journal_path)
+            journal.append_packet(200, {"source": "binance_ws", "sequence_id": 2})
+            journal.append(JournalEntry(event_type="GAP", timestamp=100, data={"qty": Decimal("1.5")}))
+            journal.close()
+
+            reader = JournalReader(journal_path)
+            self.assertEqual(reader.load(), 2)
+            events = [e.event for e in reader]
+            self.assertEqual([e.timestamp for e in events], [100, 200])
+            self.assertEqual(events[0].data, {"qty": "1.5"})
         finally:
             os.unlink(journal_path)
 
+class TestReplayEngine(unittest.TestCase):
+    def test_empty_journal(self):
+        config = SimulatorConfig(
+            config_hash="test",
+            rng_seed=42,
+            journal_path="memory"
+        )
+        engine = ReplayEngine(config, journal=io.BytesIO(b""))
+        verdict = engine.run()
+        self.assertEqual(verdict.status, VerdictStatus.PASS)
+        self.assertEqual(verdict.events_processed, 0)
+
     def test_replay_produces_hash_log(self):
-        # Create journal with one event
+        # Journal with one event
         event = {
             "event_type": "PACKET",
             "timestamp": 1000000,
             "data": {"source": "binance_ws", "drift_us": 100}
         }
+        config = SimulatorConfig(
+            config_hash="test",
+            rng_seed=42,
+            journal_path="memory"
+        )
+        engine = ReplayEngine(config, journal=io.BytesIO(json.dumps(event).encode() + b"\n"))
+        verdict = engine.run()
+        self.assertEqual(verdict.status, VerdictStatus.PASS)
+        self.assertEqual(len(engine.hash_log), 1)
+
+    def test_journal_events_available_after_run(self):
+        events = b"".join(
+            json.dumps({"event_type": "GAP", "timestamp": ts, "data": {}}).encode() + b"\n"
+            for ts in (3, 1, 2)
+        )
+        config = SimulatorConfig(config_hash="test", rng_seed=42, journal_path="memory")
+        engine = ReplayEngine(config, journal=io.BytesIO(events))
+        engine.run()
+
+        self.assertEqual(len(engine.journal), 3)
+        self.assertEqual([e.local_arrival_ts for e in engine.journal], [1, 2, 3])
+        self.assertEqual(engine.journal.get_event(0).local_arrival_ts, 1)
+
+    def test_execution_report_with_null_symbol(self):
+        # A NEW/REJECTED report may carry no symbol; it is stored, not an error
+        event = {
+            "event_type": "PACKET",
+            "timestamp": 1000000,
+            "data": {"source": "execution_report", "status": "REJECTED", "client_order_id": "a", "symbol": None}
+        }
+        config = SimulatorConfig(config_hash="test", rng_seed=42, journal_path="memory")
+        engine = ReplayEngine(config, journal=io.BytesIO(json.dumps(event).encode() + b"\n"))
+        verdict = engine.run()
+        self.assertEqual(verdict.status, VerdictStatus.PASS)
+        self.assertEqual(engine.state.get_order("a")["status"], "REJECTED")
+
+    def test_hash_interval_checkpoints(self):
+        events = [
+            {"event_type": "GAP", "timestamp": ts, "data": {"source": "binance_ws"}}
+            for ts in range(8)
+        ]
         with tempfile.NamedTemporaryFile(mode='w', suffix='.jsonl', delete=False) as f:
-            f.write(json.dumps(event) + "\n")
+            f.write("".join(json.dumps(e) + "\n" for e in events))
             journal_path = f.name
-        
+
         try:
-            config = SimulatorConfig(
-                config_hash="test",
-                rng_seed=42,
-                journal_path=journal_path
-            )
-            engine = ReplayEngine(config)
-            verdict = engine.run()
+            full = ReplayEngine(SimulatorConfig(config_hash="test", rng_seed=42, journal_path=journal_path))
+            full.run()
+            sparse = ReplayEngine(SimulatorConfig(
+                config_hash="test", rng_seed=42, journal_path=journal_path, hash_interval=3
+            ))
+            verdict = sparse.run()
+
+            self.assertEqual(verdict.status, VerdictStatus.PASS)
+            self.assertEqual(verdict.events_processed, 8)
+            # Every 3rd event plus the last one, with the same hashes as a full run
+            self.assertEqual(sorted(sparse.hash_log), [0, 3, 6, 7])
+            for index, state_hash in sparse.hash_log.items():
+                self.assertEqual(state_hash, full.hash_log[index])
+        finally:
+            os.unlink(journal_path)
+
+    def test_parallel_verify_finds_first_divergence(self):
+        events = [
+            {"event_type": "GAP", "timestamp": ts, "data": {"source": "binance_ws"}}
+            for ts in range(20)
+        ]
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.jsonl', delete=False) as f:
+            f.write("".join(json.dumps(e) + "\n" for e in events))
+            journal_path = f.name
+
+        try:
+            engine = ReplayEngine(SimulatorConfig(config_hash="test", rng_seed=42, journal_path=journal_path))
+            engine.run()
+            engine.reference_hashes = dict(engine.hash_log)
+            self.assertIsNone(engine.verify_hash_log_parallel(workers=2))
+
+            engine.reference_hashes[13] = "0" * 64
+            engine.reference_hashes[17] = "0" * 64
+            divergence = engine.verify_hash_log_parallel(workers=2)
+            self.assertEqual(divergence.event_index, 13)
+            self.assertEqual(divergence.actual_hash, engine.hash_log[13])
+        finally:
+            os.unlink(journal_path)
+
+    def test_parallel_replay_matches_sequential_final_state(self):
+        events = []
+        for ts in range(40):
+            if ts % 4 == 0:
+                events.append({"event_type": "GAP", "timestamp": ts, "data": {"source": "binance_ws"}})
+            elif ts % 9 == 0:
+                events.append({"event_type": "STATUS_CHANGE", "timestamp": ts, "data": {"status": "CONNECTED"}})
+            else:
+                events.append({"event_type": "PACKET", "timestamp": ts, "data": {
+                    "source": "execution_report", "status": "FILLED",
+                    "client_order_id": f"o{ts % 7}", "symbol": f"S{ts % 3}",
+                    "filled_quantity": "0.5", "side": "BUY" if ts % 2 else "SELL"
+                }})
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.jsonl', delete=False) as f:
+            f.write("".join(json.dumps(e) + "\n" for e in events))
+            journal_path = f.name
+
+        try:
+            sequential = ReplayEngine(SimulatorConfig(config_hash="test", rng_seed=42, journal_path=journal_path))
+            sequential.run()
+            parallel = ReplayEngine(SimulatorConfig(config_hash="test", rng_seed=42, journal_path=journal_path))
+            verdict = parallel.run_parallel(workers=4)
+
             self.assertEqual(verdict.status, VerdictStatus.PASS)
-            self.assertEqual(len(engine.hash_log), 1)
+            self.assertEqual(verdict.events_processed, 40)
+            self.assertEqual(list(parallel.hash_log), [39])
+            self.assertEqual(parallel.hash_log[39], sequential.hash_log[39])
+            self.assertEqual(parallel.state.snapshot(), sequential.state.snapshot())
         finally:
             os.unlink(journal_path)
 
@@ -0,0 +1,59 @@
+import unittest
+import random
+import statistics
+from src.core.state import ObserverState, DRIFT_VECTOR_MIN_BATCH
+
+class TestDriftStats(unittest.TestCase):
+    def test_rolling_stats_match_full_recompute(self):
+        state = ObserverState() # redis.from_url connects lazily
+        rng = random.Random(7)
+        window = []
+        for _ in range(200):
+            drift = rng.randint(-1_000_000, 1_000_000)
+            stats = state.update_drift(drift)
+            window = (window + [drift])[-state.max_drift_samples:]
+
+            self.assertEqual(stats.sample_count, len(window))
+            self.assertEqual(state.drift_window().tolist(), window)
+            self.assertAlmostEqual(stats.mean_us, statistics.mean(window), places=6)
+            if len(window) > 1:
+                expected = statistics.linear_regression(range(len(window)), window).slope
+                self.assertAlmostEqual(stats.slope, expected, places=6)
+
+    def test_batch_update_matches_per_sample(self):
+        single = ObserverState()
+        batched = ObserverState()
+        rng = random.Random(11)
+        for size in (1, 7, 49, 50, 51, 130, 3):
+            drifts = [rng.randint(-1_000_000, 1_000_000) for _ in range(size)]
+            expected = [single.update_drift(d).mean_us for d in drifts]
+            means = batched.update_drift_batch(drifts)
+
+            self.assertEqual(len(means), size)
+            for got, want in zip(means, expected):
+                self.assertAlmostEqual(got, want, places=6)
+            self.assertEqual(batched.drift_window().tolist(), single.drift_window().tolist())
+            # Running sums carry over: the next single update agrees too
+            d = rng.randint(-1_000_000, 1_000_000)
+            self.assertEqual(batched.update_drift(d), single.update_drift(d))
+
+    def test_small_and_vectorized_batches_agree(self):
+        vectorized = ObserverState()
+        small = ObserverState()
+        rng = random.Random(5)
+        drifts = [rng.randint(-1_000_000, 1_000_000) for _ in range(4 * DRIFT_VECTOR_MIN_BATCH)]
+
+        means_vec = vectorized.update_drift_batch(drifts)
+        means_small = []
+        for i in range(0, len(drifts), 5):
+            means_small.extend(small.update_drift_batch(drifts[i:i + 5]))
+
+        self.assertEqual(len(means_small), len(means_vec))
+        for got, want in zip(means_small, means_vec):
+            self.assertAlmostEqual(got, want, places=6)
+        self.assertEqual(small.drift_window().tolist(), vectorized.drift_window().tolist())
+        d = rng.randint(-1_000_000, 1_000_000)
+        self.assertEqual(small.update_drift(d), vectorized.update_drift(d))
+
+if __name__ == '__main__':
+    unittest.main()
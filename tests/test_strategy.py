@@ -0,0 +1,97 @@
+import unittest
+from abc import abstractmethod
+import numpy as np
+from src.core.types import Signal
+from src.strategies.base_strategy import BaseStrategy, invalidate_risk_cache
+
+def _threshold_kernel(prices, params):
+    return np.where(prices > params[0], 1.0, 0.0)
+
+class _Strategy(BaseStrategy):
+    __slots__ = ()
+    SIGNAL_PARAMS = [100]
+    _signal_kernel = staticmethod(_threshold_kernel)
+
+    def calculate_position_size(self, account_balance):
+        return 0
+
+class _BucketRiskManager:
+    def __init__(self):
+        self.bucket = 0
+        self.calls = 0
+
+    def stateless_key(self, symbol, signal):
+        return self.bucket
+
+    def validate_trade(self, symbol, signal):
+        self.calls += 1
+        return signal != Signal.SELL
+
+class TestStrategyContract(unittest.TestCase):
+    def test_signal_params_normalized(self):
+        self.assertEqual(_Strategy.SIGNAL_PARAMS.dtype, np.float64)
+        strategy = _Strategy("test", "BTCUSDT", "1m")
+        self.assertIs(strategy.generate_signal([99, 101]), Signal.BUY)
+        self.assertIs(strategy.generate_signal([101, 99]), Signal.HOLD)
+
+    def test_signal_logic_required(self):
+        with self.assertRaises(TypeError):
+            class _NoSignal(BaseStrategy):
+                __slots__ = ()
+
+                def calculate_position_size(self, account_balance):
+                    return 0
+
+    def test_abstract_intermediate_base_allowed(self):
+        class _TrendBase(BaseStrategy):
+            __slots__ = ()
+
+            @abstractmethod
+            def trend_window(self):
+                pass
+
+        class _Trend(_TrendBase):
+            __slots__ = ()
+            SIGNAL_PARAMS = [100]
+            _signal_kernel = staticmethod(_threshold_kernel)
+
+            def trend_window(self):
+                return 20
+
+            def calculate_position_size(self, account_balance):
+                return 0
+
+        with self.assertRaises(TypeError):
+            _TrendBase("test", "BTCUSDT", "1m")
+        self.assertIs(_Trend("test", "BTCUSDT", "1m").generate_signal([101.0]), Signal.BUY)
+
+class TestCheckRisk(unittest.TestCase):
+    def setUp(self):
+        invalidate_risk_cache()
+
+    def test_validation_cached_per_key(self):
+        strategy = _Strategy("test", "BTCUSDT", "1m")
+        rm = _BucketRiskManager()
+        for _ in range(100):
+            self.assertTrue(strategy.check_risk(Signal.BUY, rm))
+        self.assertFalse(strategy.check_risk(Signal.SELL, rm))
+        self.assertEqual(rm.calls, 2)
+
+        rm.bucket = 1
+        strategy.check_risk(Signal.BUY, rm)
+        self.assertEqual(rm.calls, 3)
+
+        invalidate_risk_cache()
+        strategy.check_risk(Signal.BUY, rm)
+        self.assertEqual(rm.calls, 4)
+
+    def test_no_key_calls_through(self):
+        strategy = _Strategy("test", "BTCUSDT", "1m")
+        rm = _BucketRiskManager()
+        rm.stateless_key = lambda symbol, signal: None
+        strategy.check_risk(Signal.BUY, rm)
+        strategy.check_risk(Signal.BUY, rm)
+        self.assertEqual(rm.calls, 2)
+
+if __name__ == '__main__':
+    unittest.main()